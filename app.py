@@ -1,15 +1,27 @@
 """Streamlit web application for uploading and processing SOL documents"""
 
 import streamlit as st
+import asyncio
+import gzip
+import multiprocessing
+import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from sol_formatter.parser import SOLParser
-from sol_formatter.openai_extractor import OpenAIExtractor
-import pandas as pd
-import json
-from datetime import datetime
+from sol_formatter.parser import PARSER_OUTPUT_VERSION, parse_file
+from sol_formatter.cache import ResultCache, content_hash
+from sol_formatter import json_utils
+from sol_formatter.openai_extractor import OpenAIExtractor, group_documents
+from functools import lru_cache
 import os
 
+# Maximum number of OpenAI requests in flight at once
+OPENAI_MAX_CONCURRENCY = 10
+
+# Characters of a standard statement shown in the Standards table
+STATEMENT_PREVIEW_CHARS = 100
+
 
 def main():
     st.set_page_config(
@@ -58,6 +70,14 @@ def main():
             elif model == "gpt-4o":
                 st.caption("💰 ~$0.10-0.30 per document")
 
+            docs_per_request = st.number_input(
+                "Documents per request",
+                min_value=1,
+                max_value=8,
+                value=1,
+                help="Bundle similarly sized documents into one API request to share the prompt tokens"
+            )
+
         output_format = st.multiselect(
             "Output Format",
             ["JSON", "CSV", "Preview"],
@@ -81,96 +101,235 @@ def main():
                 if not api_key:
                     st.error("Please enter your OpenAI API key")
                     return
-                process_documents_with_openai(uploaded_files, output_format, api_key, model)
+                process_documents_with_openai(
+                    uploaded_files, output_format, api_key, model, docs_per_request
+                )
             else:
                 process_documents(uploaded_files, output_format)
 
 
-def process_documents_with_openai(uploaded_files, output_format, api_key, model):
+@lru_cache(maxsize=4096)
+def _short(text, limit):
+    """Truncated preview of text; memoized because every rerun renders the same strings"""
+    return text[:limit] + "..."
+
+
+@st.cache_resource
+def get_extractor(api_key, model):
+    """OpenAI extractor shared across reruns (sync client connections and rate limits persist; async clients are per run)"""
+    return OpenAIExtractor(api_key=api_key, model=model)
+
+
+@st.cache_resource
+def get_parse_pool():
+    """Worker processes for basic parsing, kept alive across reruns"""
+    # Spawn rather than fork: forking Streamlit's threaded server process can deadlock the workers
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+
+
+def process_documents_with_openai(uploaded_files, output_format, api_key, model, docs_per_request=1):
     """Process uploaded documents using OpenAI structured extraction"""
 
     try:
-        extractor = OpenAIExtractor(api_key=api_key, model=model)
+        extractor = get_extractor(api_key, model)
     except ValueError as e:
         st.error(f"Error initializing OpenAI: {str(e)}")
         return
 
-    all_results = []
-    total_tokens = 0
-
     # Progress bar
     progress_bar = st.progress(0)
     status_text = st.empty()
 
-    for idx, uploaded_file in enumerate(uploaded_files):
-        # Update progress
-        progress = (idx + 1) / len(uploaded_files)
-        progress_bar.progress(progress)
-        status_text.text(f"Processing {uploaded_file.name} with OpenAI...")
+    # Identifies this result set for the cached display helpers
+    upload_keys = [_upload_cache_key(f, "openai", model) for f in uploaded_files]
+    ordered_results = [None] * len(uploaded_files)
 
-        try:
-            # Save uploaded file to temporary location
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
+    status_text.text(f"Processing {len(uploaded_files)} document(s) with OpenAI...")
 
-            # Extract structured data using OpenAI
-            result = extractor.extract_structured_data(tmp_path)
-            all_results.append(result)
-            total_tokens += result["_extraction_metadata"]["tokens_used"]
+    total_tokens = 0
+    cached = 0
+
+    # One directory for this run's uploads; removed with everything in it on exit
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_paths = _save_uploads(uploaded_files, range(len(uploaded_files)), tmp_dir)
+
+        # Send all requests concurrently, bounded by OPENAI_MAX_CONCURRENCY;
+        # the extractor answers previously extracted documents from its cache
+        extracted = asyncio.run(_extract_all(
+            extractor, tmp_paths, uploaded_files, docs_per_request, progress_bar, status_text
+        ))
+        for idx, result in extracted.items():
+            ordered_results[idx] = result
+            if result["_extraction_metadata"].get("cached"):
+                cached += 1
+            else:
+                total_tokens += result["_extraction_metadata"]["tokens_used"]
 
-            # Clean up temp file
-            Path(tmp_path).unlink()
+    progress_bar.progress(1.0)
 
-        except Exception as e:
-            st.error(f"Error processing {uploaded_file.name}: {str(e)}")
+    all_results = [r for r in ordered_results if r is not None]
 
-    status_text.text("Processing complete!")
+    status_text.text(f"Processing complete! ({cached} from cache)")
+
+    results_key = tuple(key for key, r in zip(upload_keys, ordered_results) if r is not None)
 
     # Display results
-    display_openai_results(all_results, output_format, total_tokens)
+    display_openai_results(all_results, output_format, total_tokens, results_key)
+
+
+async def _extract_group(semaphore, extractor, group):
+    """Run one async extraction request once a semaphore slot is free"""
+    idxs = [idx for idx, _ in group]
+    paths = [tmp_path for _, tmp_path in group]
+
+    async with semaphore:
+        try:
+            if len(paths) == 1:
+                results = [await extractor.aextract_structured_data(paths[0])]
+            else:
+                results = await extractor.aextract_structured_data_batch(paths)
+            return idxs, results, None
+        except Exception as e:
+            return idxs, [None] * len(idxs), e
+
+
+async def _extract_all(extractor, tmp_paths, uploaded_files, docs_per_request, progress_bar, status_text):
+    """Extract all documents concurrently, updating progress as each request finishes"""
+    semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+    results = {}
+
+    # Group uploads into requests of similarly sized documents
+    idx_by_path = {tmp_path: idx for idx, tmp_path in tmp_paths.items()}
+    groups = [
+        [(idx_by_path[tmp_path], tmp_path) for tmp_path in group]
+        for group in group_documents(list(tmp_paths.values()), docs_per_request)
+    ]
+
+    tasks = [_extract_group(semaphore, extractor, group) for group in groups]
+
+    # One async client for this run, closed before asyncio.run shuts the loop down
+    async with extractor.async_client():
+        for done, next_done in enumerate(asyncio.as_completed(tasks), 1):
+            idxs, group_results, error = await next_done
+
+            # Update progress
+            progress_bar.progress(done / len(tasks))
+            status_text.text(f"Processed {', '.join(uploaded_files[idx].name for idx in idxs)} with OpenAI")
+
+            for idx, result in zip(idxs, group_results):
+                name = uploaded_files[idx].name
+                if error is not None:
+                    st.error(f"Error processing {name}: {str(error)}")
+                elif result is None:
+                    st.error(f"Error processing {name}: no result returned by the model")
+                else:
+                    results[idx] = result
+
+    return results
+
+
+def _save_uploads(uploaded_files, indices, tmp_dir):
+    """
+    Stream uploaded files into tmp_dir in 1 MiB chunks, keeping their original names
+
+    The parser reads document metadata from the file name, so names are preserved;
+    a repeated name gets its own subdirectory.
+
+    Returns:
+        Dict mapping upload index to the saved file path
+    """
+    tmp_paths = {}
+    used_names = set()
+
+    for idx in indices:
+        uploaded_file = uploaded_files[idx]
+        target_dir = Path(tmp_dir)
+        if uploaded_file.name in used_names:
+            target_dir = target_dir / str(idx)
+            target_dir.mkdir()
+        used_names.add(uploaded_file.name)
+
+        tmp_path = target_dir / uploaded_file.name
+        uploaded_file.seek(0)
+        with open(tmp_path, 'wb') as tmp_file:
+            shutil.copyfileobj(uploaded_file, tmp_file, length=1 << 20)
+        tmp_paths[idx] = str(tmp_path)
+
+    return tmp_paths
+
+
+def _upload_cache_key(uploaded_file, *key_parts):
+    """Cache key for an uploaded file's contents, name and processing options"""
+    uploaded_file.seek(0)
+    key = content_hash(uploaded_file, uploaded_file.name, *key_parts)
+    uploaded_file.seek(0)
+    return key
 
 
 def process_documents(uploaded_files, output_format):
     """Process uploaded documents and display results (basic extraction)"""
 
-    parser = SOLParser()
-    all_results = []
-
     # Progress bar
     progress_bar = st.progress(0)
     status_text = st.empty()
 
-    for idx, uploaded_file in enumerate(uploaded_files):
-        # Update progress
-        progress = (idx + 1) / len(uploaded_files)
-        progress_bar.progress(progress)
-        status_text.text(f"Processing {uploaded_file.name}...")
+    # Reuse results for files that were already parsed
+    cache = ResultCache()
+    cache_keys = [_upload_cache_key(f, "parser", PARSER_OUTPUT_VERSION) for f in uploaded_files]
+    ordered_results = [cache.get(key) for key in cache_keys]
 
-        try:
-            # Save uploaded file to temporary location
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
+    pending = [idx for idx, result in enumerate(ordered_results) if result is None]
 
-            # Parse document
-            result = parser.parse_document(tmp_path)
-            all_results.append(result)
+    cached = len(uploaded_files) - len(pending)
+    status_text.text(f"Processing {len(pending)} document(s) ({cached} cached)...")
 
-            # Clean up temp file
-            Path(tmp_path).unlink()
+    # One directory for this run's uploads; removed with everything in it on exit
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_paths = _save_uploads(uploaded_files, pending, tmp_dir)
 
-        except Exception as e:
-            st.error(f"Error processing {uploaded_file.name}: {str(e)}")
+        # Parse documents in parallel on the shared worker pool
+        executor = get_parse_pool()
+        futures = {
+            executor.submit(parse_file, tmp_path): idx
+            for idx, tmp_path in tmp_paths.items()
+        }
+
+        for done, future in enumerate(as_completed(futures), 1):
+            idx = futures[future]
+            name = uploaded_files[idx].name
+
+            # Update progress
+            progress_bar.progress(done / len(futures))
+            status_text.text(f"Processed {name}")
+
+            try:
+                ordered_results[idx] = future.result()
+                cache.put(cache_keys[idx], ordered_results[idx])
+            except BrokenProcessPool as e:
+                # A worker died; start a fresh pool on the next run
+                get_parse_pool.clear()
+                st.error(f"Error processing {name}: {str(e)}")
+            except Exception as e:
+                st.error(f"Error processing {name}: {str(e)}")
+
+    progress_bar.progress(1.0)
+
+    all_results = [r for r in ordered_results if r is not None]
 
     status_text.text("Processing complete!")
 
+    results_key = tuple(key for key, r in zip(cache_keys, ordered_results) if r is not None)
+
     # Display results
-    display_results(all_results, output_format)
+    display_results(all_results, output_format, results_key)
 
 
-def display_results(results, output_format):
-    """Display processing results in various formats"""
+def display_results(results, output_format, results_key):
+    """Display processing results in various formats (results_key identifies the result set)"""
+
+    # Display-only dependencies are imported on first use so script reruns skip them
+    import pandas as pd
+    from datetime import datetime
 
     st.header("Processing Results")
 
@@ -195,40 +354,55 @@ def display_results(results, output_format):
     with tabs[0]:
         st.subheader("Document Overview")
 
-        overview_data = []
+        # Build column lists directly instead of a list of row dicts
+        overview_cols = {
+            "File": [],
+            "Type": [],
+            "Grade Level": [],
+            "Subject": [],
+            "Standards Found": [],
+            "Paragraphs": [],
+            "Tables": []
+        }
         for result in results:
             metadata = result['metadata']
-            overview_data.append({
-                "File": result['source_file'],
-                "Type": metadata.get('type', 'Unknown'),
-                "Grade Level": metadata.get('grade_level', 'Unknown'),
-                "Subject": metadata.get('subject', 'N/A'),
-                "Standards Found": len(result['content']['identified_standards']),
-                "Paragraphs": result['content']['total_paragraphs'],
-                "Tables": result['content']['total_tables']
-            })
-
-        df_overview = pd.DataFrame(overview_data)
+            content = result['content']
+            overview_cols["File"].append(result['source_file'])
+            overview_cols["Type"].append(metadata.get('type', 'Unknown'))
+            overview_cols["Grade Level"].append(metadata.get('grade_level', 'Unknown'))
+            overview_cols["Subject"].append(metadata.get('subject', 'N/A'))
+            overview_cols["Standards Found"].append(len(content['identified_standards']))
+            overview_cols["Paragraphs"].append(content['total_paragraphs'])
+            overview_cols["Tables"].append(content['total_tables'])
+
+        df_overview = pd.DataFrame(overview_cols, copy=False)
         st.dataframe(df_overview, use_container_width=True)
 
     # Standards tab
     with tabs[1]:
         st.subheader("All Identified Standards")
 
-        standards_data = []
+        # Per-document fields are repeated once per standard with a single extend
+        standards_cols = {
+            "Standard": [],
+            "Source": [],
+            "Grade Level": [],
+            "Subject": [],
+            "Type": []
+        }
         for result in results:
             metadata = result['metadata']
-            for standard in result['content']['identified_standards']:
-                standards_data.append({
-                    "Standard": standard,
-                    "Source": result['source_file'],
-                    "Grade Level": metadata.get('grade_level', 'Unknown'),
-                    "Subject": metadata.get('subject', 'Mathematics'),
-                    "Type": metadata.get('type', 'Unknown')
-                })
+            standards = result['content']['identified_standards']
+            count = len(standards)
+            standards_cols["Standard"].extend(standards)
+            standards_cols["Source"].extend([result['source_file']] * count)
+            standards_cols["Grade Level"].extend([metadata.get('grade_level', 'Unknown')] * count)
+            standards_cols["Subject"].extend([metadata.get('subject', 'Mathematics')] * count)
+            standards_cols["Type"].extend([metadata.get('type', 'Unknown')] * count)
+
+        df_standards = pd.DataFrame(standards_cols, copy=False)
 
-        if standards_data:
-            df_standards = pd.DataFrame(standards_data)
+        if not df_standards.empty:
             st.dataframe(df_standards, use_container_width=True)
 
             # Filter options
@@ -264,13 +438,14 @@ def display_results(results, output_format):
     with tabs[2]:
         st.subheader("Detailed Document Content")
 
+        source_files, file_to_idx = _source_file_index(results_key, results)
         selected_doc = st.selectbox(
             "Select a document to view details",
-            [r['source_file'] for r in results]
+            source_files
         )
 
         if selected_doc:
-            result = next(r for r in results if r['source_file'] == selected_doc)
+            result = results[file_to_idx[selected_doc]]
 
             # Metadata
             st.markdown("**Document Metadata:**")
@@ -281,7 +456,7 @@ def display_results(results, output_format):
 
             with st.expander("View Paragraphs"):
                 for idx, para in enumerate(result['content']['paragraphs'][:20], 1):
-                    st.text(f"{idx}. {para['text'][:200]}...")
+                    st.text(f"{idx}. {_short(para['text'], 200)}")
 
             with st.expander("View Tables"):
                 for idx, table in enumerate(result['content']['tables'], 1):
@@ -295,50 +470,45 @@ def display_results(results, output_format):
         # JSON export
         if "JSON" in output_format:
             json_data = {
-                "processed_date": datetime.now().isoformat(),
                 "total_documents": len(results),
                 "documents": results
             }
 
             st.download_button(
-                label="Download JSON",
-                data=json.dumps(json_data, indent=2, ensure_ascii=False),
-                file_name=f"sol_documents_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
+                label="Download JSON (gzip)",
+                data=_json_export_bytes(("documents", results_key), "processed_date", json_data),
+                file_name=f"sol_documents_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json.gz",
+                mime="application/gzip"
             )
 
         # CSV export
-        if "CSV" in output_format and standards_data:
-            df_standards = pd.DataFrame(standards_data)
-
+        if "CSV" in output_format and not df_standards.empty:
             st.download_button(
-                label="Download CSV",
-                data=df_standards.to_csv(index=False),
-                file_name=f"sol_standards_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                label="Download CSV (gzip)",
+                data=_csv_export_bytes(("standards", results_key), df_standards),
+                file_name=f"sol_standards_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv.gz",
+                mime="application/gzip"
             )
 
 
-def display_openai_results(results, output_format, total_tokens):
-    """Display OpenAI-extracted structured results"""
+def display_openai_results(results, output_format, total_tokens, results_key):
+    """Display OpenAI-extracted structured results (results_key identifies the result set)"""
+
+    # Display-only dependencies are imported on first use so script reruns skip them
+    import pandas as pd
+    from datetime import datetime
 
     st.header("Structured Extraction Results")
 
     # Summary statistics
     col1, col2, col3, col4 = st.columns(4)
 
-    total_strands = sum(len(r.get('strands', [])) for r in results)
-    total_standards = sum(
-        sum(len(strand.get('standards', [])) for strand in r.get('strands', []))
-        for r in results
-    )
-    total_objectives = sum(
-        sum(
-            sum(len(std.get('knowledge_and_skills', [])) for std in strand.get('standards', []))
-            for strand in r.get('strands', [])
-        )
-        for r in results
-    )
+    # Flatten once; every tab below reads from these frames
+    df_strands, df_std, df_obj = _flatten_openai_results(results)
+
+    total_strands = len(df_strands)
+    total_standards = len(df_std)
+    total_objectives = len(df_obj)
 
     with col1:
         st.metric("Documents", len(results))
@@ -358,23 +528,16 @@ def display_openai_results(results, output_format, total_tokens):
     with tabs[0]:
         st.subheader("All Standards")
 
-        standards_data = []
-        for doc in results:
-            doc_meta = doc.get('document_metadata', {})
-            for strand in doc.get('strands', []):
-                for standard in strand.get('standards', []):
-                    standards_data.append({
-                        "Standard ID": standard.get('standard_id', ''),
-                        "Statement": standard.get('standard_statement', '')[:100] + "...",
-                        "Strand": strand.get('strand_name', ''),
-                        "Grade": doc_meta.get('grade_level', ''),
-                        "Objectives": len(standard.get('knowledge_and_skills', [])),
-                        "Cognitive Level": standard.get('cognitive_level', ''),
-                        "Tags": ", ".join(standard.get('tags', [])[:3])
-                    })
-
-        if standards_data:
-            df = pd.DataFrame(standards_data)
+        if not df_std.empty:
+            df = pd.DataFrame({
+                "Standard ID": _column(df_std, 'standard.standard_id'),
+                "Statement": _column(df_std, 'standard.standard_statement').str[:STATEMENT_PREVIEW_CHARS] + "...",
+                "Strand": _column(df_std, 'strand.strand_name'),
+                "Grade": _column(df_std, 'document_metadata.grade_level'),
+                "Objectives": _column(df_std, 'standard.knowledge_and_skills', None).str.len().fillna(0).astype(int),
+                "Cognitive Level": _column(df_std, 'standard.cognitive_level'),
+                "Tags": _column(df_std, 'standard.tags', None).str[:3].str.join(", ").fillna('')
+            })
             st.dataframe(df, use_container_width=True)
 
             # Filters
@@ -416,24 +579,22 @@ def display_openai_results(results, output_format, total_tokens):
                         st.markdown(strand['strand_description'])
 
                     for std in strand.get('standards', [])[:3]:  # Show first 3
-                        st.markdown(f"**{std.get('standard_id', '')}:** {std.get('standard_statement', '')[:150]}...")
+                        st.markdown(f"**{std.get('standard_id', '')}:** {_short(std.get('standard_statement', ''), 150)}")
 
     # Full Structure tab
     with tabs[2]:
         st.subheader("Complete Structured Data")
 
-        selected_doc = st.selectbox(
-            "Select Document",
-            [f"{r.get('document_metadata', {}).get('grade_level', 'Unknown')} ({r.get('_extraction_metadata', {}).get('source_file', '')})"
-             for r in results]
-        )
+        labels, label_to_idx = _structured_doc_labels(results_key, results)
+        selected_doc = st.selectbox("Select Document", labels)
 
         if selected_doc and results:
-            idx = [f"{r.get('document_metadata', {}).get('grade_level', 'Unknown')} ({r.get('_extraction_metadata', {}).get('source_file', '')})"
-                   for r in results].index(selected_doc)
-            result = results[idx]
+            result = results[label_to_idx[selected_doc]]
 
-            st.json(result)
+            # An expander toggles in the browser; a checkbox would rerun the script
+            # and drop these results, which are only rendered on the Process click
+            with st.expander("Full JSON", expanded=True):
+                st.code(json_utils.dumps(result, indent=True).decode('utf-8'), language="json")
 
     # Export tab
     with tabs[3]:
@@ -442,51 +603,145 @@ def display_openai_results(results, output_format, total_tokens):
         # JSON export
         if "JSON" in output_format:
             json_data = {
-                "extracted_date": datetime.now().isoformat(),
                 "total_documents": len(results),
                 "total_tokens": total_tokens,
                 "documents": results
             }
 
             st.download_button(
-                label="Download Complete JSON",
-                data=json.dumps(json_data, indent=2, ensure_ascii=False),
-                file_name=f"sol_structured_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
+                label="Download Complete JSON (gzip)",
+                data=_json_export_bytes(("structured", results_key, total_tokens), "extracted_date", json_data),
+                file_name=f"sol_structured_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json.gz",
+                mime="application/gzip"
             )
 
         # CSV export of standards
-        if "CSV" in output_format and standards_data:
-            # Create detailed CSV
-            detailed_data = []
-            for doc in results:
-                doc_meta = doc.get('document_metadata', {})
-                for strand in doc.get('strands', []):
-                    for standard in strand.get('standards', []):
-                        for obj in standard.get('knowledge_and_skills', []):
-                            detailed_data.append({
-                                "Standard ID": standard.get('standard_id', ''),
-                                "Standard Statement": standard.get('standard_statement', ''),
-                                "Strand Code": strand.get('strand_code', ''),
-                                "Strand Name": strand.get('strand_name', ''),
-                                "Grade Level": doc_meta.get('grade_level', ''),
-                                "Objective": obj.get('objective_text', ''),
-                                "Action Verb": obj.get('action_verb', ''),
-                                "Examples": "; ".join(obj.get('examples', [])),
-                                "Constraints": "; ".join(obj.get('constraints', [])),
-                                "Cognitive Level": standard.get('cognitive_level', ''),
-                                "Tags": "; ".join(standard.get('tags', []))
-                            })
-
-            if detailed_data:
-                df_detailed = pd.DataFrame(detailed_data)
+        if "CSV" in output_format and not df_std.empty:
+            # Create detailed CSV (one row per objective)
+            if not df_obj.empty:
+                df_detailed = pd.DataFrame({
+                    "Standard ID": _column(df_obj, 'standard.standard_id'),
+                    "Standard Statement": _column(df_obj, 'standard.standard_statement'),
+                    "Strand Code": _column(df_obj, 'strand.strand_code'),
+                    "Strand Name": _column(df_obj, 'strand.strand_name'),
+                    "Grade Level": _column(df_obj, 'document_metadata.grade_level'),
+                    "Objective": _column(df_obj, 'objective.objective_text'),
+                    "Action Verb": _column(df_obj, 'objective.action_verb'),
+                    "Examples": _column(df_obj, 'objective.examples', None).str.join("; ").fillna(''),
+                    "Constraints": _column(df_obj, 'objective.constraints', None).str.join("; ").fillna(''),
+                    "Cognitive Level": _column(df_obj, 'standard.cognitive_level'),
+                    "Tags": _column(df_obj, 'standard.tags', None).str.join("; ").fillna('')
+                })
                 st.download_button(
-                    label="Download Detailed CSV",
-                    data=df_detailed.to_csv(index=False),
-                    file_name=f"sol_detailed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
+                    label="Download Detailed CSV (gzip)",
+                    data=_csv_export_bytes(("detailed", results_key), df_detailed),
+                    file_name=f"sol_detailed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv.gz",
+                    mime="application/gzip"
                 )
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def _source_file_index(results_key, _results):
+    """Source file names of parsed documents and a name -> position lookup; rebuilt only when results_key changes"""
+    source_files = [r['source_file'] for r in _results]
+    return source_files, _first_index(source_files)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _structured_doc_labels(results_key, _results):
+    """Selectbox labels for extracted documents and a label -> position lookup; rebuilt only when results_key changes"""
+    labels = [
+        f"{r.get('document_metadata', {}).get('grade_level', 'Unknown')} "
+        f"({r.get('_extraction_metadata', {}).get('source_file', '')})"
+        for r in _results
+    ]
+    return labels, _first_index(labels)
+
+
+def _first_index(labels):
+    """Map each label to the position of its first occurrence (same result as list.index)"""
+    index = {}
+    for i, label in enumerate(labels):
+        index.setdefault(label, i)
+    return index
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _json_export_bytes(export_key, date_field, _data):
+    """
+    Gzip-compressed JSON export; recomputed only when export_key changes
+
+    The export is stamped with date_field here, so the recorded time is when
+    these bytes were built rather than a caller's value the cache ignores.
+    """
+    from datetime import datetime
+
+    return gzip.compress(
+        json_utils.dumps({date_field: datetime.now().isoformat(), **_data}, indent=True),
+        compresslevel=6
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _csv_export_bytes(export_key, _df):
+    """Gzip-compressed CSV export; recomputed only when export_key changes"""
+    return gzip.compress(_df.to_csv(index=False).encode('utf-8'), compresslevel=6)
+
+
+def _flatten_openai_results(results):
+    """
+    Flatten extracted documents into strand, standard and objective rows
+
+    Each level is expanded with json_normalize + explode rather than a
+    record_path, so documents with missing keys simply contribute no rows.
+    Parent fields (document metadata, strand and standard fields) are carried
+    down to every child row. Each level's fields get their own prefix
+    ('strand.', 'standard.', 'objective.'), so a key repeated at several levels
+    (e.g. top-level 'standards' or 'tags') never collides with its parent's.
+
+    Returns:
+        Tuple of (strands, standards, objectives) DataFrames
+    """
+    import pandas as pd
+
+    df_docs = pd.json_normalize(results)
+    df_strands = _explode_records(df_docs, 'strands', 'strand.')
+    df_std = _explode_records(df_strands, 'strand.standards', 'standard.')
+    df_obj = _explode_records(df_std, 'standard.knowledge_and_skills', 'objective.', text_field='objective_text')
+    return df_strands, df_std, df_obj
+
+
+def _explode_records(df, column, prefix, text_field=None):
+    """
+    Expand a column of record lists into one row per record, with the record fields as prefixed columns
+
+    An entry that is not a record (the model sometimes returns an objective as a
+    bare string) becomes {text_field: entry}, or an empty record without text_field.
+    """
+    import pandas as pd
+
+    if column not in df:
+        return df.iloc[0:0]
+
+    exploded = df.explode(column, ignore_index=True)
+    exploded = exploded[exploded[column].notna()].reset_index(drop=True)
+    records = [
+        record if isinstance(record, dict) else ({text_field: record} if text_field else {})
+        for record in exploded[column]
+    ]
+    records = pd.json_normalize(records, max_level=0).add_prefix(prefix)
+
+    return pd.concat([exploded.drop(columns=[column]), records], axis=1)
+
+
+def _column(df, name, default=''):
+    """Column of a flattened frame, or a column of defaults when no record had the field"""
+    import pandas as pd
+
+    if name in df:
+        return df[name].fillna(default) if default is not None else df[name]
+    return pd.Series(default, index=df.index, dtype=object)
+
+
 if __name__ == "__main__":
     main()
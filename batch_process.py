@@ -1,26 +1,43 @@
 """Batch processing script for SOL documents"""
 
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from sol_formatter.parser import SOLParser
+from sol_formatter.parser import PARSER_OUTPUT_VERSION, SOLParser
+from sol_formatter.cache import ResultCache
+from sol_formatter import json_utils
 import argparse
-import json
+import csv
 from datetime import datetime
 
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None  # tqdm not installed, print one line per document instead
 
-def process_all_documents(input_dir: str = "sol_formatter/sol_documents", output_dir: str = "sol_formatter/sol_documents/output"):
+# Columns of the combined all_standards.csv
+COMBINED_CSV_HEADER = ['Standard', 'Source File', 'Document Type', 'Grade Level', 'Subject']
+
+
+def process_all_documents(
+    input_dir: str = "sol_formatter/sol_documents",
+    output_dir: str = "sol_formatter/sol_documents/output",
+    force_refresh: bool = False
+):
     """
     Process all .docx files in the input directory
 
     Args:
         input_dir: Directory containing .docx files (default: current directory)
         output_dir: Directory to save processed output
+        force_refresh: Parse every document again, ignoring cached results
     """
     # Create output directory if it doesn't exist
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Initialize parser
+    # Parser used for writing cached documents' files (parsing itself runs in worker processes)
     parser = SOLParser()
 
     # Find all .docx files
@@ -34,55 +51,72 @@ def process_all_documents(input_dir: str = "sol_formatter/sol_documents", output
     print(f"Found {len(docx_files)} documents to process")
     print("-" * 60)
 
-    all_results = []
     successful = 0
     failed = 0
 
-    # Process each document
-    for idx, file_path in enumerate(docx_files, 1):
-        try:
-            print(f"[{idx}/{len(docx_files)}] Processing: {file_path.name}")
+    cache = ResultCache(output_path / ".cache")
+    jsonl_path = output_path / "all_documents.jsonl"
+    csv_path = output_path / "all_standards.csv"
+
+    # Combined outputs are appended as each document finishes, so results are not kept in memory
+    with open(jsonl_path, 'wb') as jsonl_file, \
+            open(csv_path, 'w', newline='', encoding='utf-8') as csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(COMBINED_CSV_HEADER)
+
+        # Reuse results for documents unchanged since the last run
+        pending = []
+        for file_path in docx_files:
+            key = _file_cache_key(file_path)
+            result = None if force_refresh else cache.get(key)
+            if result is None:
+                pending.append((file_path, key))
+                continue
+
+            _save_document_outputs(parser, result, file_path, output_path)
+            _append_combined(jsonl_file, csv_writer, result)
+            successful += 1
 
-            # Parse document
-            result = parser.parse_document(str(file_path))
+        if len(pending) < len(docx_files):
+            print(f"Reused cached results for {len(docx_files) - len(pending)} unchanged document(s)")
+            print()
 
-            # Save individual JSON file
-            output_filename = file_path.stem + ".json"
-            json_path = output_path / output_filename
-            parser.save_json(result, str(json_path))
+        # Parse and save remaining documents in parallel, one worker process per core
+        if pending:
+            workers = min(len(pending), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    partial(_process_one, out_dir=str(output_path)),
+                    [str(file_path) for file_path, _ in pending],
+                    chunksize=4
+                )
 
-            # Save individual CSV file for standards
-            csv_filename = file_path.stem + "_standards.csv"
-            csv_path = output_path / csv_filename
-            parser.save_csv(result, str(csv_path))
+                for idx, ((file_path, key), result) in enumerate(_progress(zip(pending, results), len(pending)), 1):
+                    if "error" in result:
+                        _log(f"  ✗ Error processing {file_path.name}: {result['error']}")
+                        failed += 1
+                        continue
 
-            all_results.append(result)
-            successful += 1
+                    _append_combined(jsonl_file, csv_writer, result)
+                    cache.put(key, result)
+                    successful += 1
 
-            print(f"  ✓ Extracted {len(result['content']['identified_standards'])} standards")
-            print(f"  ✓ Saved to: {json_path.name}")
+                    if tqdm is None:
+                        print(f"[{idx}/{len(pending)}] {file_path.name}: "
+                              f"✓ {len(result['content']['identified_standards'])} standards")
 
-        except Exception as e:
-            print(f"  ✗ Error processing {file_path.name}: {str(e)}")
-            failed += 1
+            print()
 
-        print()
+    print(f"✓ Combined CSV saved: {csv_path.name}")
 
-    # Save combined results
-    combined_output = {
+    # Assemble the combined JSON from the JSONL file, one line at a time
+    combined_path = output_path / "all_documents.json"
+    json_utils.merge_jsonl(jsonl_path, combined_path, {
         "processed_date": datetime.now().isoformat(),
         "total_documents": len(docx_files),
         "successful": successful,
-        "failed": failed,
-        "documents": all_results
-    }
-
-    combined_path = output_path / "all_documents.json"
-    with open(combined_path, 'w', encoding='utf-8') as f:
-        json.dump(combined_output, f, indent=2, ensure_ascii=False)
-
-    # Create combined CSV of all standards
-    create_combined_csv(all_results, output_path / "all_standards.csv")
+        "failed": failed
+    })
 
     # Print summary
     print("=" * 60)
@@ -95,26 +129,73 @@ def process_all_documents(input_dir: str = "sol_formatter/sol_documents", output
     print(f"Combined output: {combined_path.name}")
 
 
-def create_combined_csv(results, output_path):
-    """Create a single CSV file with all standards from all documents"""
-    import csv
-
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(['Standard', 'Source File', 'Document Type', 'Grade Level', 'Subject'])
-
-        for result in results:
-            metadata = result['metadata']
-            for standard in result['content']['identified_standards']:
-                writer.writerow([
-                    standard,
-                    result['source_file'],
-                    metadata.get('type', 'Unknown'),
-                    metadata.get('grade_level', 'Unknown'),
-                    metadata.get('subject', 'Mathematics')
-                ])
+def _process_one(file_path: str, out_dir: str) -> dict:
+    """
+    Parse one document and write its individual JSON and CSV files
 
-    print(f"✓ Combined CSV saved: {output_path.name}")
+    Runs in a worker process. Failures are returned as {"error": ..., "file": ...}
+    instead of raised, so one bad document does not abort the whole map.
+    """
+    try:
+        parser = SOLParser()
+        result = parser.parse_document(file_path)
+        _save_document_outputs(parser, result, Path(file_path), Path(out_dir))
+        return result
+    except Exception as e:
+        return {"error": str(e), "file": file_path}
+
+
+def _progress(iterable, total: int):
+    """Wrap an iterable in a tqdm progress bar when tqdm is installed"""
+    if tqdm is not None:
+        return tqdm(iterable, total=total, desc="Parsing", unit="doc")
+    return iterable
+
+
+def _log(message: str):
+    """Print without breaking an active progress bar"""
+    if tqdm is not None:
+        tqdm.write(message)
+    else:
+        print(message)
+
+
+def _file_cache_key(file_path: Path) -> str:
+    """Cache key for a document: file stem, modification time and size, plus the parser output version"""
+    stat = file_path.stat()
+    return f"{file_path.stem}-{stat.st_mtime_ns}-{stat.st_size}-v{PARSER_OUTPUT_VERSION}"
+
+
+def _save_document_outputs(parser: SOLParser, result, file_path: Path, output_path: Path) -> Path:
+    """Save individual JSON and standards CSV files for one document"""
+    # Save individual JSON file
+    output_filename = file_path.stem + ".json"
+    json_path = output_path / output_filename
+    parser.save_json(result, str(json_path))
+
+    # Save individual CSV file for standards
+    csv_filename = file_path.stem + "_standards.csv"
+    csv_path = output_path / csv_filename
+    parser.save_csv(result, str(csv_path))
+
+    return json_path
+
+
+def _append_combined(jsonl_file, csv_writer, result):
+    """Append one document to the combined JSONL file and its standards to the combined CSV"""
+    jsonl_file.write(json_utils.dumps(result) + b"\n")
+
+    metadata = result['metadata']
+    csv_writer.writerows(
+        [
+            standard,
+            result['source_file'],
+            metadata.get('type', 'Unknown'),
+            metadata.get('grade_level', 'Unknown'),
+            metadata.get('subject', 'Mathematics')
+        ]
+        for standard in result['content']['identified_standards']
+    )
 
 
 def main():
@@ -131,10 +212,15 @@ def main():
         default='sol_formatter/sol_documents/output',
         help='Directory to save processed output (default: sol_formatter/sol_documents/output)'
     )
+    parser.add_argument(
+        '--force-refresh',
+        action='store_true',
+        help='Parse every document again instead of reusing cached results'
+    )
 
     args = parser.parse_args()
 
-    process_all_documents(args.input_dir, args.output_dir)
+    process_all_documents(args.input_dir, args.output_dir, force_refresh=args.force_refresh)
 
 
 if __name__ == "__main__":
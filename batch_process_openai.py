@@ -1,8 +1,9 @@
 """Batch processing script using OpenAI for structured extraction"""
 
+import logging
 import os
 from pathlib import Path
-from sol_formatter.openai_extractor import OpenAIExtractor
+from sol_formatter.openai_extractor import OpenAIExtractor, DEFAULT_MAX_CONCURRENCY
 import argparse
 
 
@@ -11,7 +12,13 @@ def process_all_documents_with_openai(
     output_dir: str = "sol_formatter/sol_documents/output",
     api_key: str = None,
     model: str = "gpt-4o-mini",
-    save_raw_text: bool = False
+    save_raw_text: bool = False,
+    use_batch_api: bool = False,
+    poll_interval: int = 30,
+    docs_per_request: int = 1,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    force_refresh: bool = False,
+    skip_guides: bool = False
 ):
     """
     Process all .docx files using OpenAI for structured extraction
@@ -22,6 +29,12 @@ def process_all_documents_with_openai(
         api_key: OpenAI API key (or set OPENAI_API_KEY environment variable)
         model: OpenAI model to use (gpt-4o-mini recommended for cost, gpt-4o for quality)
         save_raw_text: Save raw extracted text files for debugging
+        use_batch_api: Submit all documents as one OpenAI Batch API job (50% cheaper, up to 24h)
+        poll_interval: Seconds between Batch API status checks
+        docs_per_request: Documents bundled into each API request (shares the system prompt)
+        max_concurrency: Maximum number of API requests in flight at once
+        force_refresh: Ignore cached text and responses and call the API for every document
+        skip_guides: Leave out instructional guides, which have no standards to extract
     """
     # Find all .docx files
     input_path = Path(input_dir)
@@ -41,11 +54,26 @@ def process_all_documents_with_openai(
         print("  Option 2: Pass --api-key parameter")
         return
 
+    if use_batch_api:
+        extractor.extract_batch_async_api(
+            [str(f) for f in docx_files],
+            output_dir=output_dir,
+            save_raw_text=save_raw_text,
+            poll_interval=poll_interval,
+            force_refresh=force_refresh,
+            skip_guides=skip_guides
+        )
+        return
+
     # Process all documents
     extractor.extract_batch(
         [str(f) for f in docx_files],
         output_dir=output_dir,
-        save_raw_text=save_raw_text
+        save_raw_text=save_raw_text,
+        docs_per_request=docs_per_request,
+        max_concurrency=max_concurrency,
+        force_refresh=force_refresh,
+        skip_guides=skip_guides
     )
 
 
@@ -70,6 +98,12 @@ Examples:
   # Process specific directory
   python batch_process_openai.py --input-dir path/to/documents
 
+  # Submit as one Batch API job (50% cheaper, results within 24h)
+  python batch_process_openai.py --use-batch-api
+
+  # Bundle small documents, 4 per request, to share the prompt tokens
+  python batch_process_openai.py --docs-per-request 4
+
 Models:
   - gpt-4o-mini: Fast, cost-effective (~$0.15 per 1M tokens) - RECOMMENDED
   - gpt-4o: Higher quality, more expensive (~$2.50 per 1M tokens)
@@ -104,15 +138,63 @@ Cost estimate per document: $0.01-0.05 for gpt-4o-mini, $0.10-0.30 for gpt-4o
         action='store_true',
         help='Save raw extracted text files for debugging'
     )
+    parser.add_argument(
+        '--use-batch-api',
+        action='store_true',
+        help='Submit all documents as one OpenAI Batch API job (50%% cheaper, completes within 24h)'
+    )
+    parser.add_argument(
+        '--poll-interval',
+        type=int,
+        default=30,
+        help='Seconds between Batch API status checks (default: 30)'
+    )
+    parser.add_argument(
+        '--docs-per-request',
+        type=int,
+        default=1,
+        help='Bundle up to N similarly sized documents into each API request (default: 1)'
+    )
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f'Maximum number of API requests in flight at once (default: {DEFAULT_MAX_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--force-refresh',
+        action='store_true',
+        help='Ignore cached extractions and call the API for every document'
+    )
+    parser.add_argument(
+        '--skip-guides',
+        action='store_true',
+        help='Skip instructional guides (no standards to extract) to save tokens'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only report errors and warnings, not per-document progress'
+    )
 
     args = parser.parse_args()
 
+    # Extractor progress goes through logging; show it as plain lines (other libraries stay at WARNING)
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("sol_formatter").setLevel(logging.WARNING if args.quiet else logging.INFO)
+
     process_all_documents_with_openai(
         input_dir=args.input_dir,
         output_dir=args.output_dir,
         api_key=args.api_key,
         model=args.model,
-        save_raw_text=args.save_raw_text
+        save_raw_text=args.save_raw_text,
+        use_batch_api=args.use_batch_api,
+        poll_interval=args.poll_interval,
+        docs_per_request=args.docs_per_request,
+        max_concurrency=args.max_concurrency,
+        force_refresh=args.force_refresh,
+        skip_guides=args.skip_guides
     )
 
 
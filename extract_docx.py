@@ -1,26 +1,26 @@
 import sys
-from docx import Document
+from sol_formatter.docx_reader import load_docx
+
 
 def extract_docx_content(file_path):
     """Extract text content from a .docx file with formatting information."""
-    doc = Document(file_path)
+    paragraphs, tables = load_docx(file_path)
 
     output = []
 
     # Extract paragraphs with style information
-    for i, para in enumerate(doc.paragraphs):
-        text = para.text.strip()
+    for i, (text, style) in enumerate(paragraphs):
+        text = text.strip()
         if text:  # Only include non-empty paragraphs
-            style = para.style.name if para.style else "Normal"
-            output.append(f"[{i}] [{style}] {text}")
+            output.append(f"[{i}] [{style or 'Normal'}] {text}")
 
     # Also extract tables if present
-    if doc.tables:
+    if tables:
         output.append("\n\n=== TABLES ===\n")
-        for table_idx, table in enumerate(doc.tables):
+        for table_idx, rows in enumerate(tables):
             output.append(f"\nTable {table_idx + 1}:")
-            for row_idx, row in enumerate(table.rows):
-                cells = [cell.text.strip() for cell in row.cells]
+            for row_idx, row in enumerate(rows):
+                cells = [cell.strip() for cell in row]
                 output.append(f"  Row {row_idx + 1}: {' | '.join(cells)}")
 
     return "\n".join(output)
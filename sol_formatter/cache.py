@@ -0,0 +1,125 @@
+"""On-disk cache for parsed and extracted document results"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional, BinaryIO
+from . import json_utils
+
+# Default location for cached results (relative to the working directory)
+DEFAULT_CACHE_DIR = ".cache/sol"
+
+
+def content_hash(file_obj: BinaryIO, *key_parts: str) -> str:
+    """
+    Hash a file's contents together with extra key parts
+
+    Args:
+        file_obj: Binary file object, read in 1 MiB chunks from its current position
+        key_parts: Extra values that change the result (model name, file name, ...)
+
+    Returns:
+        Hex digest suitable for use as a cache key
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: file_obj.read(1 << 20), b""):
+        digest.update(chunk)
+    for part in key_parts:
+        digest.update(b"\0" + str(part).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def key_hash(*key_parts: str) -> str:
+    """
+    Hash a sequence of values (e.g. a content hash plus settings) into a cache key
+
+    Args:
+        key_parts: Values that make up the key
+
+    Returns:
+        Hex digest suitable for use as a cache key
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in key_parts:
+        digest.update(b"\0" + str(part).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Stores JSON-serializable results (and plain text) on disk, one file per key"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        Initialize result cache
+
+        Args:
+            cache_dir: Directory holding cached {key}.json / {key}.txt files (created on first write)
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached result
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached result, or None on a miss or unreadable entry
+        """
+        try:
+            return json_utils.loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, data: Dict[str, Any]):
+        """
+        Store a result atomically (written to a temp file, then renamed into place)
+
+        Args:
+            key: Cache key
+            data: JSON-serializable result
+        """
+        self._write(self._path(key), json_utils.dumps(data))
+
+    def get_text(self, key: str) -> Optional[str]:
+        """
+        Load cached text
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached text, or None on a miss
+        """
+        try:
+            return (self.cache_dir / f"{key}.txt").read_bytes().decode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def put_text(self, key: str, text: str):
+        """
+        Store text atomically
+
+        Args:
+            key: Cache key
+            text: Text to store
+        """
+        self._write(self.cache_dir / f"{key}.txt", text.encode('utf-8'))
+
+    def _write(self, path: Path, content: bytes):
+        """Write content to a temp file in the cache directory, then rename it into place"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
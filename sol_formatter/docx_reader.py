@@ -0,0 +1,184 @@
+"""Streaming .docx reader built on zipfile + lxml.iterparse"""
+
+import zipfile
+from typing import Iterator, Optional, Tuple, Union
+from docx import Document
+from docx.styles import BabelFish
+from lxml import etree
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W = f"{{{W_NS}}}"
+NS = {"w": W_NS}
+
+DOCUMENT_PART = "word/document.xml"
+STYLES_PART = "word/styles.xml"
+
+_BODY = W + "body"
+_P = W + "p"
+_TBL = W + "tbl"
+_STYLE = W + "style"
+
+_RUN_CONTENT_XPATH = etree.XPath("w:r/* | w:hyperlink/w:r/*", namespaces=NS)
+_P_STYLE_XPATH = etree.XPath("string(w:pPr/w:pStyle/@w:val)", namespaces=NS)
+_TR_XPATH = etree.XPath("w:tr", namespaces=NS)
+_TC_XPATH = etree.XPath("w:tc", namespaces=NS)
+_TC_P_XPATH = etree.XPath("w:p", namespaces=NS)
+_GRID_BEFORE_XPATH = etree.XPath("string(w:trPr/w:gridBefore/@w:val)", namespaces=NS)
+_GRID_SPAN_XPATH = etree.XPath("string(w:tcPr/w:gridSpan/@w:val)", namespaces=NS)
+_V_MERGE_XPATH = etree.XPath("w:tcPr/w:vMerge", namespaces=NS)
+_STYLE_NAME_XPATH = etree.XPath("string(w:name/@w:val)", namespaces=NS)
+
+# Text equivalents of run content elements (matches python-docx Run.text)
+_RUN_CONTENT_TEXT = {
+    W + "tab": "\t",
+    W + "ptab": "\t",
+    W + "cr": "\n",
+    W + "noBreakHyphen": "-",
+}
+
+# ("paragraph", text, style name) or ("table", rows of cell texts)
+BodyItem = Union[Tuple[str, str, Optional[str]], Tuple[str, list]]
+
+# ([(paragraph text, style name), ...], [table rows of cell texts, ...])
+DocxContent = Tuple[list[Tuple[str, Optional[str]]], list[list[list[str]]]]
+
+
+def paragraph_text(p) -> str:
+    """Concatenate the run and hyperlink text of a <w:p> element (same as python-docx Paragraph.text)"""
+    parts = []
+    for el in _RUN_CONTENT_XPATH(p):
+        tag = el.tag
+        if tag == W + "t":
+            parts.append(el.text or "")
+        elif tag == W + "br":
+            if el.get(W + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_RUN_CONTENT_TEXT.get(tag, ""))
+    return "".join(parts)
+
+
+def table_rows(tbl) -> list[list[str]]:
+    """
+    Cell texts of each row of a <w:tbl> element (same as python-docx row.cells)
+
+    Horizontally spanned cells are repeated once per grid column, and vertically
+    merged cells repeat the text of the cell they continue.
+    """
+    rows = []
+    above = {}
+    for tr in _TR_XPATH(tbl):
+        offset = int(_GRID_BEFORE_XPATH(tr) or 0)
+        row = []
+        current = {}
+        for tc in _TC_XPATH(tr):
+            span = int(_GRID_SPAN_XPATH(tc) or 1)
+            v_merge = _V_MERGE_XPATH(tc)
+            if v_merge and v_merge[0].get(W + "val", "continue") == "continue" and offset in above:
+                text = above[offset]
+            else:
+                text = "\n".join(paragraph_text(p) for p in _TC_P_XPATH(tc))
+            current[offset] = text
+            row.extend([text] * span)
+            offset += span
+        above = current
+        rows.append(row)
+    return rows
+
+
+def paragraph_style_names(z: zipfile.ZipFile) -> Tuple[dict, Optional[str]]:
+    """
+    Map paragraph style IDs to UI style names (as python-docx reports them)
+
+    Returns:
+        Tuple of (style ID -> name, name of the default paragraph style); names
+        are None where python-docx would report no style or no name
+    """
+    names = {}
+    default = None
+    try:
+        f = z.open(STYLES_PART)
+    except KeyError:
+        return names, "Normal"  # python-docx falls back to its default template styles
+
+    with f:
+        for _, style in etree.iterparse(f, tag=_STYLE):
+            if style.get(W + "type") == "paragraph":
+                name = BabelFish.internal2ui(_STYLE_NAME_XPATH(style)) or None
+                names[style.get(W + "styleId")] = name
+                if style.get(W + "default") in ("1", "true", "on"):
+                    default = name
+            style.clear()
+    return names, default
+
+
+def iter_body(file_path: str) -> Iterator[BodyItem]:
+    """
+    Stream the body-level paragraphs and tables of a .docx file in document order
+
+    document.xml is parsed incrementally and each body element is discarded once
+    handled, so memory stays bounded by the largest single paragraph or table.
+    Paragraphs nested in tables are reported only as part of their table.
+
+    Args:
+        file_path: Path to the .docx file
+
+    Yields:
+        ("paragraph", text, style name or None) or ("table", rows of cell texts)
+
+    Raises:
+        KeyError: If the package has no word/document.xml part
+    """
+    with zipfile.ZipFile(file_path) as z:
+        style_names, default_style = paragraph_style_names(z)
+
+        with z.open(DOCUMENT_PART) as f:
+            for _, elem in etree.iterparse(f, tag=(_P, _TBL)):
+                parent = elem.getparent()
+                if parent is None or parent.tag != _BODY:
+                    continue  # Inside a table (or other container); handled with its parent
+
+                if elem.tag == _P:
+                    style = style_names.get(_P_STYLE_XPATH(elem), default_style)
+                    yield "paragraph", paragraph_text(elem), style
+                else:
+                    yield "table", table_rows(elem)
+
+                # Drop the handled element and everything before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+
+def load_docx(file_path: str) -> DocxContent:
+    """
+    Read the body-level paragraphs and tables of a .docx file in one pass
+
+    Shared by SOLParser and OpenAIExtractor, so a pipeline that runs both
+    decodes each document once. Values match python-docx's doc.paragraphs
+    (text, style name) and doc.tables (cell text of each row.cells).
+
+    Args:
+        file_path: Path to the .docx file
+
+    Returns:
+        Tuple of ([(text, style name or None), ...], [[[cell text, ...], ...], ...])
+    """
+    paragraphs = []
+    tables = []
+    add_paragraph = paragraphs.append
+    add_table = tables.append
+
+    try:
+        for item in iter_body(file_path):
+            if item[0] == "paragraph":
+                add_paragraph(item[1:])
+            else:
+                add_table(item[1])
+    except KeyError:
+        # Main part not at word/document.xml; let python-docx resolve it
+        doc = Document(file_path)
+        paragraphs = [(para.text, para.style.name if para.style else None) for para in doc.paragraphs]
+        tables = [[[cell.text for cell in row.cells] for row in table.rows] for table in doc.tables]
+
+    return paragraphs, tables
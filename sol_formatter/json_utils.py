@@ -0,0 +1,69 @@
+"""JSON helpers that use orjson when it is installed"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed, use the standard library json module
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON
+
+    Args:
+        data: JSON-serializable data
+        indent: If True, pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def merge_jsonl(jsonl_path: Union[str, Path], combined_path: Union[str, Path], summary: dict):
+    """
+    Write {**summary, "documents": [...]} by streaming documents from a JSONL file
+
+    Each line is copied through without being parsed, so memory use does not
+    grow with the number of documents.
+
+    Args:
+        jsonl_path: File with one JSON document per line
+        combined_path: JSON file to write
+        summary: Top-level fields written before the documents list
+    """
+    with open(jsonl_path, 'rb') as src, open(combined_path, 'wb') as out:
+        out.write(b"{\n")
+        for key, value in summary.items():
+            out.write(b'  ' + dumps(key) + b': ' + dumps(value) + b',\n')
+
+        out.write(b'  "documents": [')
+        for idx, line in enumerate(src):
+            out.write(b",\n    " if idx else b"\n    ")
+            out.write(line.rstrip(b"\n"))
+        out.write(b"\n  ]\n}\n")
@@ -1,12 +1,23 @@
 """OpenAI integration for extracting structured data from SOL documents"""
 
+import asyncio
+import logging
 import os
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from docx import Document
 import json
 from typing import Dict, Any, Optional
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from .schema import OPENAI_EXTRACTION_PROMPT, EXTRACTION_SCHEMA
+from .rate_limiter import RateLimiter, DEFAULT_REQUESTS_PER_MINUTE, DEFAULT_TOKENS_PER_MINUTE
+from .cache import DEFAULT_CACHE_DIR, ResultCache, content_hash, key_hash
+from .docx_reader import DocxContent, load_docx
+from .parser import SOLParser
+from .token_utils import context_window, count_tokens, split_sections
+from . import json_utils
 
 # Load environment variables from .env file
 try:
@@ -15,17 +26,66 @@ try:
 except ImportError:
     pass  # python-dotenv not installed, use system env vars only
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None  # fastjsonschema not installed, validate_output checks required fields only
+
+logger = logging.getLogger(__name__)
+
+# Default number of API requests kept in flight by extract_batch
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Retries for connection errors, timeouts, 429 and 5xx responses. The OpenAI client
+# backs off exponentially with jitter and honors the Retry-After header.
+DEFAULT_MAX_RETRIES = 5
+
+# Shared, never-interpolated system message: every request starts with the same
+# bytes, so OpenAI's automatic prompt caching can reuse the prefix (reported as
+# usage.prompt_tokens_details.cached_tokens). Document content goes in the user message.
+_SYSTEM_MESSAGE = {"role": "system", "content": OPENAI_EXTRACTION_PROMPT}
+
+# (extractor, AsyncOpenAI client) opened by OpenAIExtractor.async_client for the current task and its children
+_ACTIVE_ACLIENT = ContextVar("sol_formatter_active_aclient", default=None)
+
+# Batch API statuses after which a batch will not make further progress
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Completion tokens reserved per document when estimating a request's token cost
+ESTIMATED_COMPLETION_TOKENS = 4096
+
+# Extracted text and API responses, keyed by document content hash
+OPENAI_CACHE_DIR = str(Path(DEFAULT_CACHE_DIR) / "openai")
+
+# Bump when extract_text_from_docx output changes so cached text and responses are rebuilt
+TEXT_FORMAT_VERSION = 1
+
+# Document types (SOLParser._parse_filename) without standards for OPENAI_EXTRACTION_PROMPT to extract
+GUIDE_DOCUMENT_TYPES = ("Instructional Guide",)
+
 
 class OpenAIExtractor:
     """Extract structured data from SOL documents using OpenAI API"""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4o-mini",
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE,
+        cache_dir: Optional[str] = OPENAI_CACHE_DIR,
+        max_retries: int = DEFAULT_MAX_RETRIES
+    ):
         """
         Initialize OpenAI extractor
 
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env variable)
             model: OpenAI model to use (default: gpt-4o-mini for cost efficiency)
+            requests_per_minute: Starting request limit for async calls (updated from API headers)
+            tokens_per_minute: Starting token limit for async calls (updated from API headers)
+            cache_dir: Directory for cached text and responses (None disables caching)
+            max_retries: Retries per request for transient errors (rate limits, server and network errors)
         """
         # Try to load API key from parameter, then .env, then system env
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -39,201 +99,882 @@ class OpenAIExtractor:
                 "3. Or set environment variable: set OPENAI_API_KEY=sk-your-key-here"
             )
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.max_retries = max_retries
+        self.client = OpenAI(api_key=self.api_key, max_retries=max_retries)
         self.model = model
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.cache = ResultCache(cache_dir) if cache_dir else None
+
+    @asynccontextmanager
+    async def async_client(self):
+        """
+        Share one AsyncOpenAI client between the async calls made inside the block
+
+        Its HTTP connections belong to the event loop they were opened on, so the
+        client lives only as long as the block and is closed on exit. Nested
+        blocks (and tasks started inside the block) reuse the outer client.
+
+        Yields:
+            The AsyncOpenAI client
+        """
+        active = _ACTIVE_ACLIENT.get()
+        if active is not None and active[0] is self:
+            yield active[1]
+            return
+
+        async with AsyncOpenAI(api_key=self.api_key, max_retries=self.max_retries) as client:
+            token = _ACTIVE_ACLIENT.set((self, client))
+            try:
+                yield client
+            finally:
+                _ACTIVE_ACLIENT.reset(token)
 
-    def extract_text_from_docx(self, file_path: str) -> str:
+    def extract_text_from_docx(self, file_path: str, docx_content: Optional[DocxContent] = None) -> str:
         """
         Extract all text content from a .docx file
 
         Args:
             file_path: Path to the .docx file
+            docx_content: The file's paragraphs and tables, if already read with load_docx
 
         Returns:
             Complete text content with paragraph breaks
         """
-        doc = Document(file_path)
+        paragraphs, tables = docx_content if docx_content is not None else load_docx(file_path)
         text_parts = []
+        append = text_parts.append
 
         # Extract paragraphs with style information
-        for para in doc.paragraphs:
-            text = para.text.strip()
+        for text, style_name in paragraphs:
+            text = text.strip()
             if text:
-                style_name = para.style.name if para.style else "Normal"
+                style_name = style_name or "Normal"
                 # Mark section headers for better structure
                 if "Head" in style_name or "Title" in style_name:
-                    text_parts.append(f"\n### {text} ###\n")
+                    append(f"\n### {text} ###\n")
                 else:
-                    text_parts.append(text)
+                    append(text)
 
         # Also extract tables (some SOL docs use tables)
-        for table in doc.tables:
-            text_parts.append("\n[TABLE]")
-            for row in table.rows:
-                row_text = " | ".join(cell.text.strip() for cell in row.cells)
+        for rows in tables:
+            append("\n[TABLE]")
+            for row in rows:
+                row_text = " | ".join([cell.strip() for cell in row])
                 if row_text.strip():
-                    text_parts.append(row_text)
-            text_parts.append("[/TABLE]\n")
+                    append(row_text)
+            append("[/TABLE]\n")
 
+        # join sizes the result once from the parts; a StringIO buffer measured no
+        # faster and peaked at the same memory, since getvalue() copies it out again
         return "\n".join(text_parts)
 
+    def build_request_body(self, doc_text: str, temperature: float = 0.1) -> Dict[str, Any]:
+        """
+        Build the chat completions request body for a document
+
+        Args:
+            doc_text: Text extracted from the .docx file
+            temperature: OpenAI temperature parameter (0-1, lower = more deterministic)
+
+        Returns:
+            Keyword arguments for chat.completions.create (also used as Batch API request body)
+        """
+        return self._request_body(
+            f"Extract structured data from this SOL document:\n\n{doc_text}",
+            temperature
+        )
+
+    def build_multi_document_request_body(
+        self,
+        documents: list[Dict[str, str]],
+        temperature: float = 0.1
+    ) -> Dict[str, Any]:
+        """
+        Build one chat completions request body covering several documents
+
+        The system prompt is shared; the per-document instructions and texts go in
+        the user message so the system prompt is identical to single-document requests.
+
+        Args:
+            documents: List of {"doc_id": ..., "text": ...} entries
+            temperature: OpenAI temperature parameter (0-1, lower = more deterministic)
+
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        return self._request_body(
+            "Extract structured data from each of the SOL documents in the JSON list below. "
+            "Return a JSON object of the form {\"results\": [...]} with exactly one entry per "
+            "document, in the same order. Each entry must contain the document's \"doc_id\" "
+            "plus all fields of the schema described above.\n\n"
+            + json.dumps(documents, ensure_ascii=False),
+            temperature
+        )
+
+    def _request_body(self, user_content: str, temperature: float) -> Dict[str, Any]:
+        """Assemble request keyword arguments around a user message"""
+        return {
+            "model": self.model,
+            "messages": [
+                _SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": user_content
+                }
+            ],
+            "temperature": temperature,
+            "response_format": {"type": "json_object"}
+        }
+
     def extract_structured_data(
         self,
         file_path: str,
         temperature: float = 0.1,
-        save_raw_text: bool = False
+        save_raw_text: bool = False,
+        force_refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Extract structured data from SOL document using OpenAI
 
+        Results are cached by document content, model, prompt and temperature;
+        a cached result is returned without calling the API. A document too large
+        for the model's context window is extracted section by section and the
+        sections' strands are merged (see merge_section_results).
+
         Args:
             file_path: Path to the .docx file
             temperature: OpenAI temperature parameter (0-1, lower = more deterministic)
             save_raw_text: If True, save extracted text to a .txt file
+            force_refresh: If True, ignore cached text and responses
 
         Returns:
             Structured JSON data matching the schema
         """
-        # Extract text from document
-        print(f"Extracting text from {Path(file_path).name}...")
-        doc_text = self.extract_text_from_docx(file_path)
+        doc_hash, cached, doc_text = self._prepare_document(
+            file_path, temperature, save_raw_text, force_refresh
+        )
+        if cached is not None:
+            return cached
 
-        # Optionally save raw text for debugging
-        if save_raw_text:
-            text_path = Path(file_path).with_suffix('.txt')
-            with open(text_path, 'w', encoding='utf-8') as f:
-                f.write(doc_text)
-            print(f"  Saved raw text to {text_path.name}")
+        return self._extract_text(doc_hash, doc_text, file_path, temperature)
+
+    def _extract_text(
+        self,
+        doc_hash: Optional[str],
+        doc_text: str,
+        file_path: str,
+        temperature: float
+    ) -> Dict[str, Any]:
+        """Request the extraction of a document's text (section by section if it is too large) and cache it"""
+        parts = self._split_for_context(doc_text, temperature)
 
         # Call OpenAI API
-        print(f"Calling OpenAI API ({self.model})...")
+        logger.info("Calling OpenAI API (%s)...", self.model)
+        if len(parts) > 1:
+            logger.info("  Document exceeds the context window; extracting %s sections separately", len(parts))
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": OPENAI_EXTRACTION_PROMPT
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Extract structured data from this SOL document:\n\n{doc_text}"
-                    }
-                ],
-                temperature=temperature,
-                response_format={"type": "json_object"}
-            )
+            responses = [
+                self.client.chat.completions.create(**self.build_request_body(part, temperature))
+                for part in parts
+            ]
+            result = self._result_from_responses(responses, file_path, temperature)
+            self._cache_result(doc_hash, temperature, result)
+            return result
+
+        except Exception as e:
+            logger.error("  ✗ Error during extraction: %s", e)
+            raise
+
+    async def aextract_structured_data(
+        self,
+        file_path: str,
+        temperature: float = 0.1,
+        save_raw_text: bool = False,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Async version of extract_structured_data
+
+        Text extraction runs in a worker thread so the event loop stays free to
+        drive other requests while this one waits on the network.
+
+        Args:
+            file_path: Path to the .docx file
+            temperature: OpenAI temperature parameter (0-1, lower = more deterministic)
+            save_raw_text: If True, save extracted text to a .txt file
+            force_refresh: If True, ignore cached text and responses
 
-            # Parse response
-            result = json.loads(response.choices[0].message.content)
+        Returns:
+            Structured JSON data matching the schema
+        """
+        doc_hash, cached, doc_text = await asyncio.to_thread(
+            self._prepare_document, file_path, temperature, save_raw_text, force_refresh
+        )
+        if cached is not None:
+            return cached
 
-            # Add metadata about the extraction
-            result["_extraction_metadata"] = {
-                "source_file": Path(file_path).name,
-                "model": self.model,
-                "temperature": temperature,
-                "tokens_used": response.usage.total_tokens,
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens
-            }
+        return await self._aextract_text(doc_hash, doc_text, file_path, temperature)
 
-            print(f"  ✓ Extraction complete ({response.usage.total_tokens} tokens)")
+    async def _aextract_text(
+        self,
+        doc_hash: Optional[str],
+        doc_text: str,
+        file_path: str,
+        temperature: float
+    ) -> Dict[str, Any]:
+        """Async version of _extract_text; the sections of a large document are requested concurrently"""
+        parts = self._split_for_context(doc_text, temperature)
+
+        # Call OpenAI API
+        logger.info("Calling OpenAI API (%s)...", self.model)
+        if len(parts) > 1:
+            logger.info("  Document exceeds the context window; extracting %s sections separately", len(parts))
+        try:
+            async with self.async_client():
+                responses = await asyncio.gather(*(
+                    self._acreate(self.build_request_body(part, temperature))
+                    for part in parts
+                ))
+            result = self._result_from_responses(responses, file_path, temperature)
+            self._cache_result(doc_hash, temperature, result)
             return result
 
         except Exception as e:
-            print(f"  ✗ Error during extraction: {str(e)}")
+            logger.error("  ✗ Error during extraction: %s", e)
+            raise
+
+    def _split_for_context(self, doc_text: str, temperature: float) -> list[str]:
+        """
+        Document text as one or more parts that each fit the model's context window
+
+        Each request must hold the prompt, the text and the completion tokens
+        reserved for the answer; larger documents are split at section headers.
+        """
+        overhead = request_tokens(self.build_request_body("", temperature))
+        budget = context_window(self.model) - overhead - ESTIMATED_COMPLETION_TOKENS
+        if count_tokens(doc_text, self.model) <= budget:
+            return [doc_text]
+        return split_sections(doc_text, budget, self.model)
+
+    def _fits_context(self, request_body: Dict[str, Any], documents: int = 1) -> bool:
+        """Whether a request's prompt plus the completion tokens reserved per document fit the context window"""
+        return (
+            request_tokens(request_body) + ESTIMATED_COMPLETION_TOKENS * documents
+            <= context_window(self.model)
+        )
+
+    async def _acreate(self, request_body: Dict[str, Any], documents: int = 1):
+        """
+        Send a chat completions request once the rate limiter has capacity for it
+
+        The estimate reserved up front is corrected with the reported usage, and
+        the limiter adopts the account limits from the x-ratelimit-* headers.
+        """
+        estimated_tokens = estimate_request_tokens(request_body, documents)
+        await self.rate_limiter.acquire(estimated_tokens)
+
+        async with self.async_client() as client:
+            raw_response = await client.chat.completions.with_raw_response.create(**request_body)
+        self.rate_limiter.calibrate(raw_response.headers)
+
+        response = raw_response.parse()
+        self.rate_limiter.reconcile(estimated_tokens, response.usage.total_tokens)
+        return response
+
+    def _prepare_document(
+        self,
+        file_path: str,
+        temperature: float,
+        save_raw_text: bool,
+        force_refresh: bool
+    ) -> tuple[Optional[str], Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Look up a document's cached result, or load its text for a new request
+
+        Returns:
+            Tuple of (content hash or None without a cache, cached result or None,
+            document text or None when the cached result is used)
+        """
+        if self.cache is None:
+            return None, None, self._read_document_text(file_path, save_raw_text)
+
+        with open(file_path, 'rb') as f:
+            doc_hash = content_hash(f)
+
+        if not force_refresh:
+            result = self.cache.get(self._response_cache_key(doc_hash, temperature))
+            if result is not None:
+                name = Path(file_path).name
+                # Same content may arrive under another name; flag it so its tokens aren't counted again
+                result["_extraction_metadata"]["source_file"] = name
+                result["_extraction_metadata"]["cached"] = True
+                logger.info("Using cached extraction for %s", name)
+                return doc_hash, result, None
+
+        text_key = key_hash(doc_hash, TEXT_FORMAT_VERSION)
+        doc_text = None if force_refresh else self.cache.get_text(text_key)
+        if doc_text is None:
+            doc_text = self._read_document_text(file_path, save_raw_text)
+            self.cache.put_text(text_key, doc_text)
+        elif save_raw_text:
+            self._save_raw_text(file_path, doc_text)
+
+        return doc_hash, None, doc_text
+
+    def _response_cache_key(self, doc_hash: str, temperature: float) -> str:
+        """Cache key for an API response: document content plus everything sent with it"""
+        return key_hash(doc_hash, self.model, OPENAI_EXTRACTION_PROMPT, temperature, TEXT_FORMAT_VERSION)
+
+    def _cache_result(self, doc_hash: Optional[str], temperature: float, result: Dict[str, Any]):
+        """Store a fresh extraction result (no-op when caching is disabled)"""
+        if self.cache is not None and doc_hash is not None:
+            self.cache.put(self._response_cache_key(doc_hash, temperature), result)
+
+    def _read_document_text(self, file_path: str, save_raw_text: bool) -> str:
+        """Extract a document's text, optionally saving it next to the .docx for debugging"""
+        logger.info("Extracting text from %s...", Path(file_path).name)
+        doc_text = self.extract_text_from_docx(file_path)
+
+        if save_raw_text:
+            self._save_raw_text(file_path, doc_text)
+
+        return doc_text
+
+    def _save_raw_text(self, file_path: str, doc_text: str):
+        """Save extracted text next to the .docx for debugging"""
+        text_path = Path(file_path).with_suffix('.txt')
+        with open(text_path, 'w', encoding='utf-8') as f:
+            f.write(doc_text)
+        logger.info("  Saved raw text to %s", text_path.name)
+
+    def _result_from_responses(self, responses: list, file_path: str, temperature: float) -> Dict[str, Any]:
+        """Parse the response(s) for a document's text, merge sections and attach extraction metadata"""
+        result = merge_section_results([
+            json_utils.loads(response.choices[0].message.content)
+            for response in responses
+        ])
+        usages = [_usage_counts(response.usage) for response in responses]
+        usage = {key: sum(counts[key] for counts in usages) for key in usages[0]}
+
+        # Add metadata about the extraction
+        result["_extraction_metadata"] = self._extraction_metadata(usage, Path(file_path).name, temperature)
+        if len(responses) > 1:
+            result["_extraction_metadata"]["sections"] = len(responses)
+
+        metadata = result["_extraction_metadata"]
+        logger.info(
+            "  ✓ Extraction complete (%s)",
+            _usage_summary(metadata["tokens_used"], metadata["cached_prompt_tokens"])
+        )
+        return result
+
+    def _extraction_metadata(
+        self,
+        usage: Dict[str, int],
+        source_file: str,
+        temperature: float,
+        **extra
+    ) -> Dict[str, Any]:
+        """_extraction_metadata for a result (usage: token counts from _usage_counts, extra: additional fields)"""
+        return {
+            "source_file": source_file,
+            "model": self.model,
+            "temperature": temperature,
+            **usage,
+            **extra
+        }
+
+    def extract_structured_data_batch(
+        self,
+        file_paths: list[str],
+        temperature: float = 0.1,
+        save_raw_text: bool = False,
+        force_refresh: bool = False
+    ) -> list[Optional[Dict[str, Any]]]:
+        """
+        Extract structured data from several documents with a single API request
+
+        Token usage is split across the documents in proportion to their text length.
+        Documents with a cached result are left out of the request, and documents
+        that do not fit the context window together are extracted one at a time.
+
+        Args:
+            file_paths: Paths to the .docx files (keep groups small, see group_documents)
+            temperature: OpenAI temperature parameter (0-1, lower = more deterministic)
+            save_raw_text: If True, save extracted text to .txt files
+            force_refresh: If True, ignore cached text and responses
+
+        Returns:
+            One result per file path, in order; None for documents missing from the response
+        """
+        prepared = [
+            self._prepare_document(file_path, temperature, save_raw_text, force_refresh)
+            for file_path in file_paths
+        ]
+        results, pending, documents = self._pending_documents(file_paths, prepared)
+        if not documents:
+            return results
+
+        request_body = self.build_multi_document_request_body(documents, temperature)
+        if not self._fits_context(request_body, len(documents)):
+            logger.info(
+                "%s documents exceed the context window together; extracting them one at a time",
+                len(documents)
+            )
+            for i in pending:
+                results[i] = self._extract_text(prepared[i][0], prepared[i][2], file_paths[i], temperature)
+            return results
+
+        logger.info("Calling OpenAI API (%s) for %s documents...", self.model, len(documents))
+        try:
+            response = self.client.chat.completions.create(**request_body)
+        except Exception as e:
+            logger.error("  ✗ Error during extraction: %s", e)
+            raise
+
+        return self._merge_multi_document_results(
+            response, file_paths, prepared, results, pending, documents, temperature
+        )
+
+    async def aextract_structured_data_batch(
+        self,
+        file_paths: list[str],
+        temperature: float = 0.1,
+        save_raw_text: bool = False,
+        force_refresh: bool = False
+    ) -> list[Optional[Dict[str, Any]]]:
+        """
+        Async version of extract_structured_data_batch
+
+        Args:
+            file_paths: Paths to the .docx files (keep groups small, see group_documents)
+            temperature: OpenAI temperature parameter (0-1, lower = more deterministic)
+            save_raw_text: If True, save extracted text to .txt files
+            force_refresh: If True, ignore cached text and responses
+
+        Returns:
+            One result per file path, in order; None for documents missing from the response
+        """
+        prepared = await asyncio.gather(*(
+            asyncio.to_thread(self._prepare_document, file_path, temperature, save_raw_text, force_refresh)
+            for file_path in file_paths
+        ))
+        results, pending, documents = self._pending_documents(file_paths, prepared)
+        if not documents:
+            return results
+
+        request_body = self.build_multi_document_request_body(documents, temperature)
+        if not self._fits_context(request_body, len(documents)):
+            logger.info(
+                "%s documents exceed the context window together; extracting them one at a time",
+                len(documents)
+            )
+            async with self.async_client():
+                new_results = await asyncio.gather(*(
+                    self._aextract_text(prepared[i][0], prepared[i][2], file_paths[i], temperature)
+                    for i in pending
+                ))
+            for i, result in zip(pending, new_results):
+                results[i] = result
+            return results
+
+        logger.info("Calling OpenAI API (%s) for %s documents...", self.model, len(documents))
+        try:
+            response = await self._acreate(request_body, documents=len(documents))
+        except Exception as e:
+            logger.error("  ✗ Error during extraction: %s", e)
             raise
 
+        return self._merge_multi_document_results(
+            response, file_paths, prepared, results, pending, documents, temperature
+        )
+
+    def _pending_documents(self, file_paths: list[str], prepared: list[tuple]) -> tuple[list, list[int], list]:
+        """
+        Split prepared documents into cached results and those still to be requested
+
+        Returns:
+            Tuple of (results with cached entries filled in, positions still pending,
+            {"doc_id": ..., "text": ...} entries for the pending documents)
+        """
+        results = [cached for _, cached, _ in prepared]
+        pending = [i for i, result in enumerate(results) if result is None]
+        # File names may repeat within a group (same name uploaded twice), so IDs are positions
+        documents = [
+            {"doc_id": str(n), "text": prepared[i][2]}
+            for n, i in enumerate(pending, 1)
+        ]
+        return results, pending, documents
+
+    def _merge_multi_document_results(
+        self,
+        response,
+        file_paths: list[str],
+        prepared: list[tuple],
+        results: list,
+        pending: list[int],
+        documents: list[Dict[str, str]],
+        temperature: float
+    ) -> list[Optional[Dict[str, Any]]]:
+        """Fill the pending positions from a multi-document response and cache the new results"""
+        names = [Path(file_paths[i]).name for i in pending]
+        new_results = self._results_from_multi_document_response(response, documents, names, temperature)
+
+        for i, result in zip(pending, new_results):
+            if result is not None:
+                self._cache_result(prepared[i][0], temperature, result)
+            results[i] = result
+
+        return results
+
+    def _results_from_multi_document_response(
+        self,
+        response,
+        documents: list[Dict[str, str]],
+        names: list[str],
+        temperature: float
+    ) -> list[Optional[Dict[str, Any]]]:
+        """Split a multi-document response into per-document results (names: source file of each document)"""
+        doc_ids = [doc["doc_id"] for doc in documents]
+        entries = json_utils.loads(response.choices[0].message.content).get("results", [])
+
+        # Match entries to documents by doc_id, falling back to position
+        by_id = {str(entry.get("doc_id")): entry for entry in entries if isinstance(entry, dict)}
+        if not all(doc_id in by_id for doc_id in doc_ids) and len(entries) == len(doc_ids):
+            by_id = dict(zip(doc_ids, entries))
+
+        total_chars = sum(len(doc["text"]) for doc in documents) or 1
+        usage = _usage_counts(response.usage)
+        results = []
+
+        for doc, name in zip(documents, names):
+            result = by_id.pop(doc["doc_id"], None)
+            if not isinstance(result, dict):
+                logger.error("  ✗ No result returned for %s", name)
+                results.append(None)
+                continue
+
+            result.pop("doc_id", None)
+            share = len(doc["text"]) / total_chars
+            result["_extraction_metadata"] = self._extraction_metadata(
+                {key: round(count * share) for key, count in usage.items()},
+                name, temperature, documents_in_request=len(documents)
+            )
+            results.append(result)
+
+        logger.info(
+            "  ✓ Extraction complete for %s documents (%s)",
+            len(documents), _usage_summary(usage["tokens_used"], usage["cached_prompt_tokens"])
+        )
+        return results
+
     def extract_batch(
         self,
         file_paths: list[str],
         output_dir: str = "sol_formatter/sol_documents",
-        save_raw_text: bool = False
+        save_raw_text: bool = False,
+        docs_per_request: int = 1,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        force_refresh: bool = False,
+        skip_guides: bool = False
     ) -> Dict[str, Any]:
         """
         Extract structured data from multiple documents
 
+        Requests are sent concurrently through the async client, with at most
+        max_concurrency in flight at once. Each result is written out as its
+        request finishes (per-file JSON plus a line in all_structured_documents.jsonl,
+        merged into all_structured_documents.json at the end), so results are not
+        held in memory and the returned summary holds counts only.
+
         Args:
             file_paths: List of paths to .docx files
             output_dir: Directory to save output files
             save_raw_text: If True, save raw text files
+            docs_per_request: Documents bundled into each API request (1 = one request per document)
+            max_concurrency: Maximum number of API requests in flight at once
+            force_refresh: If True, ignore cached text and responses
+            skip_guides: If True, leave out instructional guides (see skip_guide_documents)
 
         Returns:
-            Summary of batch processing
+            Summary of batch processing (counts, token usage, combined output path)
         """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        results = []
-        successful = 0
-        failed = 0
-        total_tokens = 0
+        if skip_guides:
+            file_paths = skip_guide_documents(file_paths)
 
-        print(f"Processing {len(file_paths)} documents...")
-        print("=" * 60)
+        logger.info("Processing %s documents...", len(file_paths))
+        logger.info("=" * 60)
 
-        for idx, file_path in enumerate(file_paths, 1):
-            print(f"\n[{idx}/{len(file_paths)}] {Path(file_path).name}")
+        groups = group_documents(file_paths, docs_per_request)
 
-            try:
-                # Extract structured data
-                result = self.extract_structured_data(
-                    file_path,
-                    save_raw_text=save_raw_text
-                )
+        combined_path = output_path / "all_structured_documents.json"
+        jsonl_path = combined_path.with_suffix(".jsonl")
 
-                # Save individual JSON file
-                output_filename = Path(file_path).stem + "_structured.json"
-                json_path = output_path / output_filename
+        # Each result is written out as its request finishes; only counts are kept
+        with open(jsonl_path, 'wb') as jsonl_file:
+            counts = asyncio.run(self._aextract_and_save(
+                groups, output_path, jsonl_file, save_raw_text, max_concurrency, force_refresh
+            ))
 
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+        summary = {"total_documents": len(file_paths), **counts}
+        return _finish_batch(summary, jsonl_path, combined_path, "BATCH PROCESSING COMPLETE")
 
-                print(f"  ✓ Saved to {output_filename}")
+    async def _aextract_and_save(
+        self,
+        groups: list[list[str]],
+        output_path: Path,
+        jsonl_file,
+        save_raw_text: bool,
+        max_concurrency: int,
+        force_refresh: bool
+    ) -> Dict[str, int]:
+        """
+        Extract all document groups concurrently, saving each result as its request finishes
 
-                results.append(result)
-                successful += 1
-                total_tokens += result["_extraction_metadata"]["tokens_used"]
+        All requests share one async client, closed once the groups are done.
 
-            except Exception as e:
-                print(f"  ✗ Failed: {str(e)}")
-                failed += 1
+        Returns:
+            Counts of successful, failed and cached documents plus tokens used
+        """
+        counts = _new_counts()
+        done = 0
 
-        # Save combined results
-        combined = {
-            "total_documents": len(file_paths),
-            "successful": successful,
-            "failed": failed,
-            "total_tokens_used": total_tokens,
-            "documents": results
-        }
+        async with self.async_client():
+            async for group, group_results in self._aiter_group_results(
+                groups, save_raw_text, max_concurrency, force_refresh
+            ):
+                done += 1
+                paths = [Path(f) for f in group]
+                logger.info("\n[%s/%s] %s", done, len(groups), ', '.join(path.name for path in paths))
+
+                if isinstance(group_results, BaseException):
+                    logger.error("  ✗ Failed: %s", group_results)
+                    counts["failed"] += len(group)
+                    continue
+
+                for path, result in zip(paths, group_results):
+                    if result is None:
+                        counts["failed"] += 1
+                        continue
+
+                    _save_result(path, result, output_path, jsonl_file, counts)
+
+        return counts
+
+    async def _aiter_group_results(
+        self,
+        groups: list[list[str]],
+        save_raw_text: bool,
+        max_concurrency: int,
+        force_refresh: bool
+    ):
+        """
+        Extract all document groups concurrently
+
+        Yields:
+            (group, its list of results or the exception that failed the request),
+            in completion order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract_group(group):
+            async with semaphore:
+                try:
+                    if len(group) == 1:
+                        return group, [await self.aextract_structured_data(
+                            group[0],
+                            save_raw_text=save_raw_text,
+                            force_refresh=force_refresh
+                        )]
+                    return group, await self.aextract_structured_data_batch(
+                        group,
+                        save_raw_text=save_raw_text,
+                        force_refresh=force_refresh
+                    )
+                except Exception as e:
+                    return group, e
+
+        for next_done in asyncio.as_completed([extract_group(group) for group in groups]):
+            yield await next_done
+
+    def extract_batch_async_api(
+        self,
+        file_paths: list[str],
+        output_dir: str = "sol_formatter/sol_documents",
+        save_raw_text: bool = False,
+        poll_interval: int = 30,
+        temperature: float = 0.1,
+        force_refresh: bool = False,
+        skip_guides: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Extract structured data from multiple documents through one OpenAI Batch API job
+
+        Batch jobs cost 50% less than regular requests and do not count against
+        the per-minute rate limits, but may take up to 24 hours. Documents with a
+        cached result are not submitted. Writes the same output files as extract_batch.
+
+        Args:
+            file_paths: List of paths to .docx files
+            output_dir: Directory to save output files
+            save_raw_text: If True, save raw text files
+            poll_interval: Seconds between batch status checks
+            temperature: OpenAI temperature parameter (0-1, lower = more deterministic)
+            force_refresh: If True, ignore cached text and responses
+            skip_guides: If True, leave out instructional guides (see skip_guide_documents)
+
+        Returns:
+            Summary of batch processing (counts, token usage, batch ID, combined output path)
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        if skip_guides:
+            file_paths = skip_guide_documents(file_paths)
 
         combined_path = output_path / "all_structured_documents.json"
-        with open(combined_path, 'w', encoding='utf-8') as f:
-            json.dump(combined, f, indent=2, ensure_ascii=False)
+        jsonl_path = combined_path.with_suffix(".jsonl")
+        batch_input_path = output_path / "batch_input.jsonl"
+
+        counts = _new_counts()
+        batch_id = None
 
-        # Print summary
-        print("\n" + "=" * 60)
-        print("BATCH PROCESSING COMPLETE")
-        print("=" * 60)
-        print(f"Successful: {successful}/{len(file_paths)}")
-        print(f"Failed: {failed}/{len(file_paths)}")
-        print(f"Total tokens used: {total_tokens:,}")
-        print(f"Output directory: {output_path.absolute()}")
-        print(f"Combined output: {combined_path.name}")
+        logger.info("Preparing Batch API input for %s documents...", len(file_paths))
+        logger.info("=" * 60)
 
-        return combined
+        with open(jsonl_path, 'wb') as jsonl_file:
+            # Build one request line per document, keyed by position and file stem (stems may repeat)
+            pending = {}
+            with open(batch_input_path, 'wb') as f:
+                for idx, file_path in enumerate(file_paths):
+                    path = Path(file_path)
+                    doc_hash, cached, doc_text = self._prepare_document(
+                        file_path, temperature, save_raw_text, force_refresh
+                    )
+                    if cached is not None:
+                        _save_result(path, cached, output_path, jsonl_file, counts)
+                        continue
+
+                    custom_id = f"{idx}-{path.stem}"
+                    pending[custom_id] = (path, doc_hash)
+                    request = {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": self.build_request_body(doc_text, temperature)
+                    }
+                    f.write(json_utils.dumps(request) + b"\n")
+
+            if pending:
+                batch = self._run_batch_job(batch_input_path, poll_interval)
+                batch_id = batch.id
+
+                if batch.status == "completed" and batch.output_file_id:
+                    output_text = self.client.files.content(batch.output_file_id).text
+                    self._save_batch_output(
+                        output_text, batch.id, pending, temperature, output_path, jsonl_file, counts
+                    )
+                else:
+                    logger.error("✗ Batch %s ended with status '%s'", batch.id, batch.status)
+                    if batch.error_file_id:
+                        logger.error("  Error details: file %s", batch.error_file_id)
+
+                # Requests missing from the output file count as failures
+                counts["failed"] = len(file_paths) - counts["successful"]
+
+        summary = {"total_documents": len(file_paths), **counts, "batch_id": batch_id}
+        return _finish_batch(summary, jsonl_path, combined_path, "BATCH API PROCESSING COMPLETE")
+
+    def _run_batch_job(self, batch_input_path: Path, poll_interval: int):
+        """Upload a Batch API input file, create the batch and poll until it finishes"""
+        with open(batch_input_path, 'rb') as f:
+            batch_file = self.client.files.create(file=f, purpose="batch")
+
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("Submitted batch %s (%s)", batch.id, self.model)
+
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            if counts:
+                logger.info(
+                    "  Status: %s (%s/%s completed, %s failed)",
+                    batch.status, counts.completed, counts.total, counts.failed
+                )
+            else:
+                logger.info("  Status: %s", batch.status)
+
+        return batch
+
+    def _save_batch_output(
+        self,
+        output_text: str,
+        batch_id: str,
+        pending: Dict[str, tuple],
+        temperature: float,
+        output_path: Path,
+        jsonl_file,
+        counts: Dict[str, int]
+    ):
+        """Map Batch API output lines back to their documents by custom_id, then save and cache them"""
+        for line in output_text.splitlines():
+            if not line.strip():
+                continue
+
+            record = json_utils.loads(line)
+            if record.get("custom_id") not in pending:
+                continue
+            path, doc_hash = pending[record["custom_id"]]
+            response = record.get("response") or {}
+
+            if record.get("error") or response.get("status_code") != 200:
+                logger.error("  ✗ Failed: %s (%s)", path.name, record.get('error') or response.get('status_code'))
+                continue
+
+            try:
+                body = response["body"]
+                result = json_utils.loads(body["choices"][0]["message"]["content"])
+                usage = _usage_counts(body["usage"])
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                logger.error("  ✗ Failed: %s (invalid response: %s)", path.name, e)
+                continue
+
+            result["_extraction_metadata"] = self._extraction_metadata(
+                usage, path.name, temperature, batch_id=batch_id
+            )
+            self._cache_result(doc_hash, temperature, result)
+            _save_result(path, result, output_path, jsonl_file, counts)
 
     def validate_output(self, data: Dict[str, Any]) -> bool:
         """
         Validate extracted data against schema
 
+        With fastjsonschema installed the full EXTRACTION_SCHEMA is checked (types,
+        enums and required fields at every level) by a validator compiled once;
+        otherwise only the required strand and standard fields are checked.
+
         Args:
             data: Extracted data dictionary
 
         Returns:
             True if valid, False otherwise
         """
+        if fastjsonschema is not None:
+            try:
+                _schema_validator()(data)
+                return True
+            except fastjsonschema.JsonSchemaException as e:
+                logger.warning("Validation error: %s", e.message)
+                return False
+
         try:
             # Basic validation - check required fields
             assert "document_metadata" in data
@@ -254,5 +995,231 @@ class OpenAIExtractor:
             return True
 
         except (AssertionError, KeyError, TypeError) as e:
-            print(f"Validation error: {str(e)}")
+            logger.warning("Validation error: %s", e)
             return False
+
+
+@lru_cache(maxsize=None)
+def _schema_validator():
+    """EXTRACTION_SCHEMA compiled by fastjsonschema into a validation function (on first use)"""
+    return fastjsonschema.compile(EXTRACTION_SCHEMA)
+
+
+def _new_counts() -> Dict[str, int]:
+    """Zeroed per-batch counters, in summary order"""
+    return {"successful": 0, "failed": 0, "cached": 0, "total_tokens_used": 0, "cached_prompt_tokens": 0}
+
+
+def _save_result(path: Path, result: Dict[str, Any], output_path: Path, jsonl_file, counts: Dict[str, int]):
+    """Write a result's individual JSON file and JSONL line, and update the batch counters"""
+    output_filename = path.stem + "_structured.json"
+    (output_path / output_filename).write_bytes(json_utils.dumps(result, indent=True))
+    logger.info("  ✓ Saved to %s", output_filename)
+
+    jsonl_file.write(json_utils.dumps(result) + b"\n")
+    counts["successful"] += 1
+    if result["_extraction_metadata"].get("cached"):
+        counts["cached"] += 1
+    else:
+        counts["total_tokens_used"] += result["_extraction_metadata"]["tokens_used"]
+        counts["cached_prompt_tokens"] += result["_extraction_metadata"].get("cached_prompt_tokens", 0)
+
+
+def _finish_batch(summary: Dict[str, Any], jsonl_path: Path, combined_path: Path, title: str) -> Dict[str, Any]:
+    """Merge a batch's JSONL output into the combined JSON file, log the summary and return it"""
+    # Save combined results, streamed from the JSONL file
+    json_utils.merge_jsonl(jsonl_path, combined_path, summary)
+
+    # Print summary
+    total = summary["total_documents"]
+    logger.info("\n" + "=" * 60)
+    logger.info(title)
+    logger.info("=" * 60)
+    logger.info("Successful: %s/%s", summary['successful'], total)
+    logger.info("Failed: %s/%s", summary['failed'], total)
+    logger.info("From cache: %s/%s", summary['cached'], total)
+    logger.info(
+        "Total tokens used: %s (%s prompt tokens from cache)",
+        format(summary["total_tokens_used"], ","), format(summary["cached_prompt_tokens"], ",")
+    )
+    logger.info("Output directory: %s", combined_path.parent.absolute())
+    logger.info("Combined output: %s (one document per line in %s)", combined_path.name, jsonl_path.name)
+
+    return {**summary, "combined_output": str(combined_path)}
+
+
+def _usage_counts(usage) -> Dict[str, int]:
+    """Token counts of a response's usage (API object or Batch API output dict), keyed as in _extraction_metadata"""
+    if isinstance(usage, dict):
+        return {
+            "tokens_used": usage["total_tokens"],
+            "prompt_tokens": usage["prompt_tokens"],
+            "completion_tokens": usage["completion_tokens"],
+            "cached_prompt_tokens": (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+        }
+    return {
+        "tokens_used": usage.total_tokens,
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "cached_prompt_tokens": cached_prompt_tokens(usage)
+    }
+
+
+def cached_prompt_tokens(usage) -> int:
+    """
+    Prompt tokens served from OpenAI's prompt cache
+
+    Args:
+        usage: Usage object of a chat completions response
+
+    Returns:
+        Cached prompt token count (0 when the API does not report it)
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    return getattr(details, "cached_tokens", None) or 0
+
+
+def _usage_summary(total_tokens: int, cached: int) -> str:
+    """Token count for progress output, noting prompt cache hits"""
+    if cached:
+        return f"{total_tokens} tokens, {cached} prompt tokens cached"
+    return f"{total_tokens} tokens"
+
+
+def request_tokens(request_body: Dict[str, Any]) -> int:
+    """
+    Prompt tokens of a chat completions request, counted with the model's tokenizer
+
+    Args:
+        request_body: Keyword arguments for chat.completions.create
+
+    Returns:
+        Token count of all message contents
+    """
+    return sum(
+        count_tokens(message["content"], request_body["model"])
+        for message in request_body["messages"]
+    )
+
+
+def merge_section_results(results: list[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine the extractions of a document's sections into one result
+
+    Top-level fields and document_metadata entries come from the first section
+    that fills them in. Strands are merged by strand_code, keeping their order
+    of first appearance; a standard reported by several sections is kept once,
+    with the knowledge_and_skills of each section appended.
+
+    Args:
+        results: Parsed responses for the sections, in document order
+
+    Returns:
+        Merged result (the only result unchanged when there is one section)
+    """
+    if len(results) == 1:
+        return results[0]
+
+    merged = {"document_metadata": {}, "strands": []}
+    strands = {}
+    standards = {}
+
+    for result in results:
+        for key, value in result.items():
+            if key not in ("document_metadata", "strands") and value and not merged.get(key):
+                merged[key] = value
+
+        metadata = merged["document_metadata"]
+        for key, value in (result.get("document_metadata") or {}).items():
+            if value and not metadata.get(key):
+                metadata[key] = value
+
+        for strand in result.get("strands") or []:
+            code = strand.get("strand_code")
+            if code not in strands:
+                strands[code] = {**strand, "standards": []}
+                standards[code] = {}
+                merged["strands"].append(strands[code])
+            target = strands[code]
+            for key, value in strand.items():
+                if key != "standards" and value and not target.get(key):
+                    target[key] = value
+
+            for standard in strand.get("standards") or []:
+                standard_id = standard.get("standard_id")
+                existing = standards[code].get(standard_id)
+                if existing is None:
+                    standards[code][standard_id] = existing = dict(standard)
+                    target["standards"].append(existing)
+                    continue
+                existing["knowledge_and_skills"] = (
+                    (existing.get("knowledge_and_skills") or [])
+                    + (standard.get("knowledge_and_skills") or [])
+                )
+
+    return merged
+
+
+def estimate_request_tokens(request_body: Dict[str, Any], documents: int = 1) -> int:
+    """
+    Rough token cost of a chat completions request (about 4 characters per token)
+
+    Args:
+        request_body: Keyword arguments for chat.completions.create
+        documents: Number of documents the request extracts
+
+    Returns:
+        Estimated prompt tokens plus the completion tokens reserved per document
+    """
+    prompt_chars = sum(len(message["content"]) for message in request_body["messages"])
+    return prompt_chars // 4 + ESTIMATED_COMPLETION_TOKENS * documents
+
+
+def skip_guide_documents(file_paths: list[str]) -> list[str]:
+    """
+    Leave out documents whose file name marks them as instructional guides
+
+    OPENAI_EXTRACTION_PROMPT extracts standards, which guides do not define.
+    Only types recognized by SOLParser._parse_filename are left out; files it
+    reports as "Unknown" (including some standards documents) are kept.
+
+    Args:
+        file_paths: Paths to .docx files
+
+    Returns:
+        The file paths to extract, in order
+    """
+    parse_filename = SOLParser()._parse_filename
+    selected = [
+        file_path for file_path in file_paths
+        if parse_filename(Path(file_path).name)["type"] not in GUIDE_DOCUMENT_TYPES
+    ]
+
+    skipped = len(file_paths) - len(selected)
+    if skipped:
+        logger.info("Skipping %s instructional guides", skipped)
+    return selected
+
+
+def group_documents(file_paths: list[str], docs_per_request: int) -> list[list[str]]:
+    """
+    Split documents into groups for multi-document requests
+
+    Files are ordered by size before chunking so each request bundles documents
+    of roughly equal length.
+
+    Args:
+        file_paths: Paths to .docx files
+        docs_per_request: Maximum number of documents per group
+
+    Returns:
+        List of file path groups
+    """
+    if docs_per_request <= 1:
+        return [[file_path] for file_path in file_paths]
+
+    ordered = sorted(file_paths, key=lambda file_path: Path(file_path).stat().st_size)
+    return [
+        ordered[i:i + docs_per_request]
+        for i in range(0, len(ordered), docs_per_request)
+    ]
@@ -1,10 +1,30 @@
 """Document parser for extracting SOL standards from .docx files"""
 
-from docx import Document
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import os
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import json
+from .docx_reader import DocxContent, load_docx
+
+# Filename patterns, compiled once
+# Numbered SOL documents (e.g., "1-2023-Approved-Math-SOL.docx")
+_SOL_RX = re.compile(r"(\d+)-(.+?)-(\d{4})-Approved-Math-SOL\.docx")
+# Instructional guides (e.g., "1. Grade 1 Mathematics Instructional Guide.docx")
+_GUIDE_RX = re.compile(r"(\d+)\.\s+Grade\s+(\d+)\s+Mathematics\s+Instructional\s+Guide\.docx")
+# Understanding the Standards (e.g., "12-AFDA-Understanding the Standards.docx")
+_UNDERSTANDING_RX = re.compile(r"(\d+)-(.+?)-Understanding\s+the\s+Standards\.docx")
+# Subject instructional guides (e.g., "11. Algebra 2 Mathematics Instructional Guide.docx")
+_SUBJECT_GUIDE_RX = re.compile(r"(\d+)\.\s+(.+?)\s+Mathematics\s+Instructional\s+Guide\.docx")
+
+# SOL standard identifiers: letter(s) followed by number (e.g., G.5, AII.7)
+# or number.number with optional letter (e.g., 1.1, 2.3a)
+_STANDARD_RX = re.compile(r"^(?:[A-Z]{1,4}\.\d+|\d+\.\d+[a-z]?)")
+
+
+# Bump when parse_document output changes so cached parser results are rebuilt
+PARSER_OUTPUT_VERSION = 1
 
 
 class SOLParser:
@@ -13,24 +33,26 @@ class SOLParser:
     def __init__(self):
         self.current_doc = None
 
-    def parse_document(self, file_path: str) -> Dict[str, Any]:
+    def parse_document(self, file_path: str, docx_content: Optional[DocxContent] = None) -> Dict[str, Any]:
         """
         Parse a SOL .docx document and extract structured data
 
         Args:
             file_path: Path to the .docx file
+            docx_content: The file's paragraphs and tables, if already read with load_docx
 
         Returns:
             Dictionary containing parsed SOL data
         """
-        doc = Document(file_path)
+        if docx_content is None:
+            docx_content = load_docx(file_path)
         filename = Path(file_path).name
 
         # Determine document type from filename
         doc_info = self._parse_filename(filename)
 
         # Extract content from document
-        content = self._extract_content(doc)
+        content = self._extract_content(*docx_content)
 
         return {
             "metadata": doc_info,
@@ -38,19 +60,34 @@ class SOLParser:
             "source_file": filename
         }
 
+    def parse_many(self, file_paths: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse several documents in parallel, one worker process per core
+
+        Args:
+            file_paths: Paths to .docx files
+            max_workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            Parsed data for each file, in input order
+
+        Raises:
+            Exception: The first error raised while parsing any of the files
+        """
+        file_paths = [str(file_path) for file_path in file_paths]
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+
+        # Starting worker processes is not worth it for a single file
+        if workers <= 1:
+            return [self.parse_document(file_path) for file_path in file_paths]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(parse_file, file_paths, chunksize=4))
+
     def _parse_filename(self, filename: str) -> Dict[str, str]:
         """Extract metadata from filename"""
 
-        # Pattern for numbered SOL documents (e.g., "1-2023-Approved-Math-SOL.docx")
-        sol_pattern = r"(\d+)-(.+?)-(\d{4})-Approved-Math-SOL\.docx"
-        # Pattern for instructional guides (e.g., "1. Grade 1 Mathematics Instructional Guide.docx")
-        guide_pattern = r"(\d+)\.\s+Grade\s+(\d+)\s+Mathematics\s+Instructional\s+Guide\.docx"
-        # Pattern for Understanding the Standards (e.g., "12-AFDA-Understanding the Standards.docx")
-        understanding_pattern = r"(\d+)-(.+?)-Understanding\s+the\s+Standards\.docx"
-        # Pattern for subject instructional guides (e.g., "11. Algebra 2 Mathematics Instructional Guide.docx")
-        subject_guide_pattern = r"(\d+)\.\s+(.+?)\s+Mathematics\s+Instructional\s+Guide\.docx"
-
-        if match := re.match(sol_pattern, filename):
+        if match := _SOL_RX.match(filename):
             num, subject, year = match.groups()
             return {
                 "type": "Approved SOL Standards",
@@ -59,7 +96,7 @@ class SOLParser:
                 "year": year,
                 "grade_level": self._get_grade_level(num, subject)
             }
-        elif match := re.match(guide_pattern, filename):
+        elif match := _GUIDE_RX.match(filename):
             num, grade = match.groups()
             return {
                 "type": "Instructional Guide",
@@ -68,7 +105,7 @@ class SOLParser:
                 "subject": "Mathematics",
                 "grade_level": f"Grade {grade}"
             }
-        elif match := re.match(understanding_pattern, filename):
+        elif match := _UNDERSTANDING_RX.match(filename):
             num, subject = match.groups()
             return {
                 "type": "Understanding the Standards",
@@ -76,7 +113,7 @@ class SOLParser:
                 "subject": subject,
                 "grade_level": self._get_grade_level(num, subject)
             }
-        elif match := re.match(subject_guide_pattern, filename):
+        elif match := _SUBJECT_GUIDE_RX.match(filename):
             num, subject = match.groups()
             return {
                 "type": "Instructional Guide",
@@ -112,31 +149,36 @@ class SOLParser:
 
         return subject_map.get(num, subject)
 
-    def _extract_content(self, doc: Document) -> Dict[str, Any]:
-        """Extract structured content from document"""
+    def _extract_content(self, doc_paragraphs: list, doc_tables: list) -> Dict[str, Any]:
+        """Extract structured content from a document's paragraphs and tables (see load_docx)"""
 
         paragraphs = []
         tables = []
         standards = []
 
+        # Bound once; these run for every paragraph and row
+        add_paragraph = paragraphs.append
+        add_standard = standards.append
+        is_standard = self._is_standard
+
         # Extract all paragraphs
-        for para in doc.paragraphs:
-            text = para.text.strip()
+        for text, style_name in doc_paragraphs:
+            text = text.strip()
             if text:
-                paragraphs.append({
+                add_paragraph({
                     "text": text,
-                    "style": para.style.name if para.style else None
+                    "style": style_name
                 })
 
                 # Try to identify SOL standards (typically formatted like "1.1", "G.5", etc.)
-                if self._is_standard(text):
-                    standards.append(text)
+                if is_standard(text):
+                    add_standard(text)
 
         # Extract tables (often contain standards and descriptions)
-        for table in doc.tables:
+        for rows in doc_tables:
             table_data = []
-            for row in table.rows:
-                row_data = [cell.text.strip() for cell in row.cells]
+            for row in rows:
+                row_data = [cell.strip() for cell in row]
                 if any(row_data):  # Skip empty rows
                     table_data.append(row_data)
             if table_data:
@@ -153,15 +195,7 @@ class SOLParser:
     def _is_standard(self, text: str) -> bool:
         """Check if text appears to be a SOL standard identifier"""
         # Common patterns: "1.1", "G.5", "AII.7", "PS.10", etc.
-        standard_patterns = [
-            r"^[A-Z]{1,4}\.\d+",  # Letter(s) followed by number (e.g., G.5, AII.7)
-            r"^\d+\.\d+[a-z]?",   # Number.number with optional letter (e.g., 1.1, 2.3a)
-        ]
-
-        for pattern in standard_patterns:
-            if re.match(pattern, text):
-                return True
-        return False
+        return _STANDARD_RX.match(text) is not None
 
     def save_json(self, data: Dict[str, Any], output_path: str):
         """Save parsed data as JSON"""
@@ -183,3 +217,19 @@ class SOLParser:
                     data['metadata'].get('grade_level', 'Unknown'),
                     data['metadata'].get('subject', 'Mathematics')
                 ])
+
+
+def parse_file(file_path: str) -> Dict[str, Any]:
+    """
+    Parse a single document with its own SOLParser instance
+
+    Defined at module level so it can be dispatched to worker processes
+    without pickling a parser.
+
+    Args:
+        file_path: Path to the .docx file
+
+    Returns:
+        Dictionary containing parsed SOL data
+    """
+    return SOLParser().parse_document(file_path)
@@ -0,0 +1,133 @@
+"""Client-side request and token rate limiting for OpenAI API calls"""
+
+import asyncio
+import threading
+import time
+from typing import Mapping
+
+# Conservative starting limits; replaced by the account's real limits once a
+# response carries x-ratelimit-* headers
+DEFAULT_REQUESTS_PER_MINUTE = 500
+DEFAULT_TOKENS_PER_MINUTE = 200_000
+
+
+class RateLimiter:
+    """
+    Dual token bucket for requests per minute and tokens per minute
+
+    Each bucket refills continuously at its per-minute rate up to one minute's
+    worth of capacity. A call is released only when both buckets cover it, so
+    requests are spaced out before the API would answer with 429 errors.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            requests_per_minute: Request budget per minute
+            tokens_per_minute: Token budget per minute (prompt + completion)
+        """
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = float(tokens_per_minute)
+        self.available_request_capacity = self.requests_per_minute
+        self.available_token_capacity = self.tokens_per_minute
+        self._last_update = time.monotonic()
+        # The extractor (and this limiter) may be shared by several threads, e.g. Streamlit sessions
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add the capacity accrued since the last update (caller holds the lock)"""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+
+        self.available_request_capacity = min(
+            self.requests_per_minute,
+            self.available_request_capacity + elapsed * self.requests_per_minute / 60
+        )
+        self.available_token_capacity = min(
+            self.tokens_per_minute,
+            self.available_token_capacity + elapsed * self.tokens_per_minute / 60
+        )
+
+    def _try_acquire(self, tokens: float) -> float:
+        """
+        Take capacity for one request if both buckets cover it
+
+        Returns:
+            0 if capacity was taken, otherwise seconds until it should be available
+        """
+        with self._lock:
+            self._refill()
+
+            # A request larger than a full bucket would otherwise never be released
+            tokens = min(tokens, self.tokens_per_minute)
+
+            if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return 0
+
+            request_wait = (1 - self.available_request_capacity) * 60 / self.requests_per_minute
+            token_wait = (tokens - self.available_token_capacity) * 60 / self.tokens_per_minute
+            return max(request_wait, token_wait, 0.001)
+
+    async def acquire(self, tokens: float):
+        """
+        Wait until one request of the given estimated size may be sent
+
+        Args:
+            tokens: Estimated total tokens (prompt + completion) for the request
+        """
+        while True:
+            wait = self._try_acquire(tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def reconcile(self, estimated_tokens: float, actual_tokens: float):
+        """
+        Correct the token bucket once a request's real usage is known
+
+        Args:
+            estimated_tokens: Tokens taken by acquire
+            actual_tokens: Tokens reported in the response usage
+        """
+        with self._lock:
+            self._refill()
+            estimated_tokens = min(estimated_tokens, self.tokens_per_minute)
+            self.available_token_capacity = min(
+                self.tokens_per_minute,
+                self.available_token_capacity + estimated_tokens - actual_tokens
+            )
+
+    def calibrate(self, headers: Mapping[str, str]):
+        """
+        Adopt the limits and remaining capacity reported by the API
+
+        Args:
+            headers: Response headers carrying x-ratelimit-limit-* and x-ratelimit-remaining-*
+        """
+        try:
+            limit_requests = float(headers["x-ratelimit-limit-requests"])
+            limit_tokens = float(headers["x-ratelimit-limit-tokens"])
+            remaining_requests = float(headers["x-ratelimit-remaining-requests"])
+            remaining_tokens = float(headers["x-ratelimit-remaining-tokens"])
+        except (KeyError, TypeError, ValueError):
+            return  # Headers missing (e.g. proxies, other providers); keep current limits
+
+        if limit_requests <= 0 or limit_tokens <= 0:
+            return
+
+        with self._lock:
+            self._refill()
+            self.requests_per_minute = limit_requests
+            self.tokens_per_minute = limit_tokens
+            # Our own in-flight reservations are already reflected in the local buckets
+            self.available_request_capacity = min(self.available_request_capacity, remaining_requests)
+            self.available_token_capacity = min(self.available_token_capacity, remaining_tokens)
@@ -0,0 +1,132 @@
+"""Token counting helpers that use tiktoken when it is installed"""
+
+import logging
+import re
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None  # tiktoken not installed, estimate about 4 characters per token
+
+logger = logging.getLogger(__name__)
+
+# Context window (prompt + completion tokens) by model name prefix
+MODEL_CONTEXT_TOKENS = {
+    "gpt-4o-mini": 128_000,
+    "gpt-4o": 128_000,
+    "gpt-4-turbo": 128_000,
+    "gpt-4": 8_192,
+    "gpt-3.5-turbo": 16_385,
+}
+DEFAULT_CONTEXT_TOKENS = 128_000
+
+# Section header lines written by OpenAIExtractor.extract_text_from_docx
+_SECTION_HEADER_RX = re.compile(r"^(?=### .* ###$)", re.MULTILINE)
+
+
+def context_window(model: str) -> int:
+    """
+    Context window size of a model
+
+    Args:
+        model: OpenAI model name, optionally with a version suffix (e.g. 'gpt-4o-2024-08-06')
+
+    Returns:
+        Maximum prompt + completion tokens per request
+    """
+    for prefix in sorted(MODEL_CONTEXT_TOKENS, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_CONTEXT_TOKENS[prefix]
+    return DEFAULT_CONTEXT_TOKENS
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    """tiktoken encoding for a model (o200k_base for models tiktoken doesn't know), None if unavailable"""
+    if tiktoken is None:
+        return None
+    try:
+        name = tiktoken.encoding_name_for_model(model)
+    except KeyError:
+        name = "o200k_base"
+
+    # tiktoken downloads encoding files on first use, which fails offline
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        logger.warning("Could not load tiktoken encoding %s (%s); estimating token counts", name, e)
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """
+    Number of tokens a model sees for a text
+
+    Args:
+        text: Text to measure
+        model: OpenAI model name
+
+    Returns:
+        Exact count with tiktoken, otherwise an estimate of 4 characters per token
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def split_sections(text: str, max_tokens: int, model: str) -> list[str]:
+    """
+    Split document text into parts of at most max_tokens tokens
+
+    Parts break at '### ... ###' section headers; consecutive sections are packed
+    into the same part while they fit. A section that is too large on its own
+    is broken at line boundaries instead, and a line that is too large on its
+    own at character boundaries.
+
+    Args:
+        text: Text from OpenAIExtractor.extract_text_from_docx
+        max_tokens: Token budget per part
+        model: OpenAI model name (selects the tokenizer)
+
+    Returns:
+        Text parts, in document order
+    """
+    units = []
+    for section in _SECTION_HEADER_RX.split(text):
+        tokens = count_tokens(section, model)
+        if tokens <= max_tokens:
+            units.append((section, tokens))
+        else:
+            for line in section.splitlines(keepends=True):
+                units.extend(_split_line(line, max_tokens, model))
+
+    parts = []
+    current = []
+    current_tokens = 0
+    for unit, tokens in units:
+        if current and current_tokens + tokens > max_tokens:
+            parts.append("".join(current))
+            current = []
+            current_tokens = 0
+        current.append(unit)
+        current_tokens += tokens
+
+    if current:
+        parts.append("".join(current))
+    return [part for part in parts if part.strip()]
+
+
+def _split_line(line: str, max_tokens: int, model: str) -> list[tuple[str, int]]:
+    """Break a line into (piece, tokens) pairs of at most max_tokens tokens each, at character boundaries"""
+    tokens = count_tokens(line, model)
+    if tokens <= max_tokens or len(line) <= 1:
+        return [(line, tokens)]
+
+    # Pieces sized by the line's average characters per token; re-split any that are still too large
+    size = max(1, len(line) * max_tokens // tokens)
+    pieces = []
+    for start in range(0, len(line), size):
+        pieces.extend(_split_line(line[start:start + size], max_tokens, model))
+    return pieces